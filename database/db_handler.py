@@ -2,9 +2,12 @@
 Database handler module for managing database operations.
 """
 import os
+import sys
 import datetime
-from sqlalchemy import create_engine, func
+from contextlib import contextmanager
+from sqlalchemy import create_engine, func, tuple_
 from sqlalchemy.orm import sessionmaker, scoped_session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 from models.schema import Base, Filament, Printer, PrinterComponent, PrintJob, FilamentIdealInventory, FilamentLinkGroup, FilamentLink, AppSettings
 
 class DatabaseHandler:
@@ -31,9 +34,30 @@ class DatabaseHandler:
         self.session_factory = sessionmaker(bind=self.engine)
         self.Session = scoped_session(self.session_factory)
         
+        # Filament list and dropdown facet caches, invalidated by bumping the version on every filament write
+        self._filaments_cache = None
+        self._facets_cache = None
+        self._filaments_version = 0
+        
+        # Inventory status cache, dropped on every filament, ideal quantity or link group write
+        self._inventory_status_cache = None
+        
         # Initialize default settings if they don't exist
         self.initialize_default_settings()
     
+    @contextmanager
+    def transaction(self):
+        """Provide a session whose work is committed once, as a single transaction."""
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
     def initialize_default_settings(self):
         """Initialize default application settings if they don't exist."""
         session = self.Session()
@@ -99,6 +123,7 @@ class DatabaseHandler:
     # Filament operations
     def add_filament(self, filament_type, color, brand, spool_weight, quantity_remaining=None, price=None, purchase_date=None):
         """Add a new filament to the inventory."""
+        self._invalidate_filaments_cache()
         session = self.Session()
         try:
             if quantity_remaining is None:
@@ -122,14 +147,72 @@ class DatabaseHandler:
         finally:
             session.close()
     
+    def add_filaments(self, filament_type, color, brand, spool_weight, quantity_remaining=None, price=None,
+                      purchase_date=None, count=1):
+        """Add one or more identical spools to the inventory in a single transaction."""
+        self._invalidate_filaments_cache()
+        if quantity_remaining is None:
+            quantity_remaining = spool_weight
+        if not purchase_date:
+            purchase_date = datetime.datetime.now()
+        
+        with self.transaction() as session:
+            filaments = [
+                Filament(
+                    type=filament_type,
+                    color=color,
+                    brand=brand,
+                    spool_weight=spool_weight,
+                    quantity_remaining=quantity_remaining,
+                    price=price,
+                    purchase_date=purchase_date
+                )
+                for _ in range(max(1, count))
+            ]
+            session.add_all(filaments)
+            session.flush()
+            return [filament.id for filament in filaments]
+    
     def get_filaments(self):
         """Get all filaments from the database."""
         session = self.Session()
         try:
-            return session.query(Filament).all()
+            filaments = session.query(Filament).all()
+            # Intern the repeated descriptor strings so equal values share one object;
+            # set_committed_value keeps the instances clean (no pending changes)
+            for filament in filaments:
+                set_committed_value(filament, 'type', sys.intern(filament.type))
+                set_committed_value(filament, 'color', sys.intern(filament.color))
+                set_committed_value(filament, 'brand', sys.intern(filament.brand))
+            return filaments
+        finally:
+            session.close()
+    
+    def get_filaments_by_ids(self, filament_ids):
+        """Get the filaments with the given IDs in a single query, ordered by ID."""
+        session = self.Session()
+        try:
+            return session.query(Filament).filter(Filament.id.in_(list(filament_ids))).order_by(Filament.id).all()
         finally:
             session.close()
     
+    def get_filaments_cached(self):
+        """Get all filaments, reusing the last result until a filament write happens."""
+        if self._filaments_cache is None or self._filaments_cache[0] != self._filaments_version:
+            self._filaments_cache = (self._filaments_version, self.get_filaments())
+        return list(self._filaments_cache[1])
+    
+    def _invalidate_filaments_cache(self):
+        """Drop the cached filament list before filament rows change."""
+        self._filaments_version += 1
+        self._filaments_cache = None
+        self._facets_cache = None
+        self._inventory_status_cache = None
+    
+    def _invalidate_inventory_status_cache(self):
+        """Drop the cached inventory status before ideal quantities or link groups change."""
+        self._inventory_status_cache = None
+    
     def get_filament_by_id(self, filament_id):
         """Get a single filament by its ID."""
         session = self.Session()
@@ -140,6 +223,7 @@ class DatabaseHandler:
     
     def update_filament_quantity(self, filament_id, new_quantity):
         """Update the remaining quantity of a filament."""
+        self._invalidate_filaments_cache()
         session = self.Session()
         try:
             filament = session.query(Filament).filter_by(id=filament_id).first()
@@ -156,25 +240,16 @@ class DatabaseHandler:
     
     def update_filament(self, filament_id, filament_type, color, brand, spool_weight, quantity_remaining, price, purchase_date):
         """Update all properties of a filament."""
+        self._invalidate_filaments_cache()
         session = self.Session()
         try:
             filament = session.query(Filament).filter_by(id=filament_id).first()
             if not filament:
                 raise ValueError(f"No filament found with ID {filament_id}")
             
-            filament.type = filament_type
-            filament.color = color
-            filament.brand = brand
-            filament.spool_weight = spool_weight
-            filament.quantity_remaining = quantity_remaining
-            filament.price = price
-            
-            # Convert string date to datetime if needed
-            if isinstance(purchase_date, str):
-                import datetime
-                purchase_date = datetime.datetime.strptime(purchase_date, "%Y-%m-%d").date()
-            
-            filament.purchase_date = purchase_date
+            self._apply_filament_update(
+                filament, filament_type, color, brand, spool_weight, quantity_remaining, price, purchase_date
+            )
             
             session.commit()
             return True
@@ -184,8 +259,47 @@ class DatabaseHandler:
         finally:
             session.close()
     
+    def update_filaments(self, updates):
+        """Update several filaments in a single transaction.
+        
+        Args:
+            updates: List of dicts holding the update_filament keyword arguments
+        """
+        self._invalidate_filaments_cache()
+        with self.transaction() as session:
+            filament_ids = [update['filament_id'] for update in updates]
+            filaments = {
+                filament.id: filament
+                for filament in session.query(Filament).filter(Filament.id.in_(filament_ids))
+            }
+            for update in updates:
+                filament = filaments.get(update['filament_id'])
+                if not filament:
+                    raise ValueError(f"No filament found with ID {update['filament_id']}")
+                self._apply_filament_update(filament, **{
+                    key: value for key, value in update.items() if key != 'filament_id'
+                })
+        return True
+    
+    def _apply_filament_update(self, filament, filament_type, color, brand, spool_weight,
+                               quantity_remaining, price, purchase_date):
+        """Set the editable properties of a filament loaded in a session."""
+        filament.type = filament_type
+        filament.color = color
+        filament.brand = brand
+        filament.spool_weight = spool_weight
+        filament.quantity_remaining = quantity_remaining
+        filament.price = price
+        
+        # Convert ISO string date to datetime if needed
+        if isinstance(purchase_date, str):
+            purchase_date = datetime.datetime.fromisoformat(purchase_date)
+        
+        filament.purchase_date = purchase_date
+    
     def delete_filament(self, filament_id):
         """Delete a filament from the database."""
+        self._invalidate_filaments_cache()
         session = self.Session()
         try:
             filament = session.query(Filament).filter_by(id=filament_id).first()
@@ -230,37 +344,61 @@ class DatabaseHandler:
         finally:
             session.close()
     
+    def get_filament_facets(self):
+        """Get the unique filament types, colors, and brands with a single query.
+        
+        Returns:
+            Tuple of (types, colors, brands) lists
+        """
+        session = self.Session()
+        try:
+            rows = session.query(Filament.type, Filament.color, Filament.brand).distinct().all()
+            # dict.fromkeys de-duplicates while keeping the query order
+            types = list(dict.fromkeys(row[0] for row in rows))
+            colors = list(dict.fromkeys(row[1] for row in rows))
+            brands = list(dict.fromkeys(row[2] for row in rows))
+            return types, colors, brands
+        finally:
+            session.close()
+    
+    def get_filament_facets_cached(self):
+        """Get the unique filament types, colors, and brands, reusing them until a filament write happens."""
+        if self._facets_cache is None or self._facets_cache[0] != self._filaments_version:
+            self._facets_cache = (self._filaments_version, self.get_filament_facets())
+        return tuple(list(values) for values in self._facets_cache[1])
+    
+    def get_distinct_filament_triples(self):
+        """Get the unique (type, color, brand) combinations, sorted by the database."""
+        session = self.Session()
+        try:
+            rows = session.query(Filament.type, Filament.color, Filament.brand).distinct().order_by(
+                Filament.type, Filament.color, Filament.brand
+            ).all()
+            return [
+                (sys.intern(row.type), sys.intern(row.color), sys.intern(row.brand))
+                for row in rows
+            ]
+        finally:
+            session.close()
+    
     def get_aggregated_filament_inventory(self):
         """Get filament inventory aggregated by type, color, and brand."""
         session = self.Session()
         try:
-            # Group filaments by type, color, and brand and sum their quantities
-            result = []
+            # Group filaments by type, color, and brand and sum their quantities in a single query
+            rows = session.query(
+                Filament.type,
+                Filament.color,
+                Filament.brand,
+                func.coalesce(func.sum(Filament.spool_weight), 0.0),
+                func.coalesce(func.sum(Filament.quantity_remaining), 0.0),
+                func.avg(Filament.price),  # Average price ignores filaments without one
+                func.count(Filament.id),
+                func.group_concat(Filament.id)
+            ).group_by(Filament.type, Filament.color, Filament.brand).all()
             
-            # Get unique combinations of type, color, brand
-            unique_filaments = session.query(
-                Filament.type, 
-                Filament.color, 
-                Filament.brand
-            ).distinct().all()
-            
-            for type_, color, brand in unique_filaments:
-                # Get all filaments matching this combination
-                matching_filaments = session.query(Filament).filter_by(
-                    type=type_,
-                    color=color,
-                    brand=brand
-                ).all()
-                
-                # Calculate total and remaining quantities
-                total_quantity = sum(f.spool_weight for f in matching_filaments)
-                quantity_remaining = sum(f.quantity_remaining for f in matching_filaments)
-                
-                # Calculate average price if available
-                prices = [f.price for f in matching_filaments if f.price is not None]
-                avg_price = sum(prices) / len(prices) if prices else None
-                
-                # Add to results
+            result = []
+            for type_, color, brand, total_quantity, quantity_remaining, avg_price, spool_count, ids in rows:
                 result.append({
                     'type': type_,
                     'color': color,
@@ -269,8 +407,8 @@ class DatabaseHandler:
                     'total_quantity': total_quantity,
                     'percentage_remaining': (quantity_remaining / total_quantity * 100) if total_quantity > 0 else 0,
                     'avg_price': avg_price,
-                    'spool_count': len(matching_filaments),
-                    'filament_ids': [f.id for f in matching_filaments]
+                    'spool_count': spool_count,
+                    'filament_ids': [int(filament_id) for filament_id in str(ids).split(',')]
                 })
                 
             return result
@@ -461,6 +599,7 @@ class DatabaseHandler:
             filament_id_4: Quaternary filament ID (optional)
             filament_used_4: Amount of quaternary filament used (optional)
         """
+        self._invalidate_filaments_cache()
         session = self.Session()
         try:
             # Check if primary filament exists
@@ -661,6 +800,7 @@ class DatabaseHandler:
         Returns:
             Dictionary with information about the updated job and restored filaments if applicable
         """
+        self._invalidate_filaments_cache()
         session = self.Session()
         try:
             job = session.query(PrintJob).filter_by(id=job_id).first()
@@ -856,6 +996,7 @@ class DatabaseHandler:
     
     def delete_print_job(self, job_id):
         """Delete a print job and restore the filament used back to inventory."""
+        self._invalidate_filaments_cache()
         session = self.Session()
         try:
             job = session.query(PrintJob).filter_by(id=job_id).first()
@@ -920,6 +1061,7 @@ class DatabaseHandler:
     # Ideal Inventory operations
     def set_ideal_filament_quantity(self, filament_type, color, brand, ideal_quantity):
         """Set the ideal quantity for a specific filament type/color/brand."""
+        self._invalidate_inventory_status_cache()
         session = self.Session()
         try:
             # Check if record already exists
@@ -978,8 +1120,12 @@ class DatabaseHandler:
         """Get the comparison between current and ideal inventory levels."""
         session = self.Session()
         try:
-            # Get the current aggregated inventory
+            # Get the current aggregated inventory, indexed by (type, color, brand)
             current_inventory = self.get_aggregated_filament_inventory()
+            current_by_key = {
+                (item['type'], item['color'], item['brand']): item
+                for item in current_inventory
+            }
             
             # Get the ideal inventory quantities from the database
             ideal_inventory = session.query(FilamentIdealInventory).all()
@@ -1011,11 +1157,10 @@ class DatabaseHandler:
                     processed_filaments.add(key)  # Mark as processed
                     
                     # Find this filament in current inventory
-                    for item in current_inventory:
-                        if item['type'] == link.type and item['color'] == link.color and item['brand'] == link.brand:
-                            group_filaments.append(item)
-                            total_current_quantity += item['quantity_remaining']
-                            break
+                    item = current_by_key.get(key)
+                    if item:
+                        group_filaments.append(item)
+                        total_current_quantity += item['quantity_remaining']
                 
                 # Calculate combined stats
                 if group_filaments:
@@ -1087,8 +1232,7 @@ class DatabaseHandler:
                 
             # Add any ideal inventory items that aren't in current inventory (completely out of stock)
             for key, ideal_qty in ideal_dict.items():
-                if not any(item['type'] == key[0] and item['color'] == key[1] and item['brand'] == key[2] 
-                          for item in current_inventory) and key not in processed_filaments:
+                if key not in current_by_key and key not in processed_filaments:
                     inventory_status.append({
                         'is_group': False,
                         'type': key[0],
@@ -1105,9 +1249,22 @@ class DatabaseHandler:
         finally:
             session.close()
             
+    def get_inventory_status_cached(self, refresh=False):
+        """Get the inventory status, reusing the last result until a write invalidates it.
+        
+        Args:
+            refresh: Re-query even if a cached result exists (e.g. rows written by another handler)
+        """
+        if refresh:
+            self._invalidate_inventory_status_cache()
+        if self._inventory_status_cache is None:
+            self._inventory_status_cache = self.get_inventory_status()
+        return list(self._inventory_status_cache)
+    
     # Filament Link Group operations
     def create_filament_link_group(self, name, description=None, ideal_quantity=0):
         """Create a new filament link group."""
+        self._invalidate_inventory_status_cache()
         session = self.Session()
         try:
             group = FilamentLinkGroup(
@@ -1126,6 +1283,7 @@ class DatabaseHandler:
     
     def update_filament_link_group(self, group_id, name=None, description=None, ideal_quantity=None):
         """Update a filament link group."""
+        self._invalidate_inventory_status_cache()
         session = self.Session()
         try:
             group = session.query(FilamentLinkGroup).filter_by(id=group_id).first()
@@ -1149,6 +1307,7 @@ class DatabaseHandler:
     
     def delete_filament_link_group(self, group_id):
         """Delete a filament link group."""
+        self._invalidate_inventory_status_cache()
         session = self.Session()
         try:
             group = session.query(FilamentLinkGroup).filter_by(id=group_id).first()
@@ -1166,6 +1325,7 @@ class DatabaseHandler:
     
     def add_filament_to_link_group(self, group_id, filament_type, color, brand):
         """Add a filament to a link group."""
+        self._invalidate_inventory_status_cache()
         session = self.Session()
         try:
             # Check if group exists
@@ -1201,6 +1361,7 @@ class DatabaseHandler:
     
     def remove_filament_from_link_group(self, group_id, filament_type, color, brand):
         """Remove a filament from a link group."""
+        self._invalidate_inventory_status_cache()
         session = self.Session()
         try:
             link = session.query(FilamentLink).filter_by(
@@ -1222,6 +1383,65 @@ class DatabaseHandler:
         finally:
             session.close()
     
+    def add_filaments_to_link_group(self, group_id, filaments):
+        """Add several (type, color, brand) filaments to a link group in a single transaction."""
+        self._invalidate_inventory_status_cache()
+        filaments = list(dict.fromkeys(tuple(filament) for filament in filaments))
+        if not filaments:
+            return True
+        
+        with self.transaction() as session:
+            # Check if group exists
+            group = session.query(FilamentLinkGroup).filter_by(id=group_id).first()
+            if not group:
+                raise ValueError(f"No filament link group found with ID {group_id}")
+            
+            # Find the groups these filaments already belong to in one query
+            existing_groups = {
+                (link.type, link.color, link.brand): link.group_id
+                for link in session.query(FilamentLink).filter(
+                    tuple_(FilamentLink.type, FilamentLink.color, FilamentLink.brand).in_(filaments)
+                )
+            }
+            
+            new_links = []
+            for filament_type, color, brand in filaments:
+                existing_group_id = existing_groups.get((filament_type, color, brand))
+                if existing_group_id is None:
+                    new_links.append(FilamentLink(
+                        group_id=group_id,
+                        type=filament_type,
+                        color=color,
+                        brand=brand
+                    ))
+                elif existing_group_id != group_id:
+                    raise ValueError(f"Filament {filament_type} {color} {brand} is already in another group")
+            
+            session.add_all(new_links)
+            return True
+    
+    def remove_filaments_from_link_group(self, group_id, filaments):
+        """Remove several (type, color, brand) filaments from a link group in a single transaction."""
+        self._invalidate_inventory_status_cache()
+        filaments = list(dict.fromkeys(tuple(filament) for filament in filaments))
+        if not filaments:
+            return True
+        
+        with self.transaction() as session:
+            links = session.query(FilamentLink).filter(
+                FilamentLink.group_id == group_id,
+                tuple_(FilamentLink.type, FilamentLink.color, FilamentLink.brand).in_(filaments)
+            ).all()
+            
+            found = {(link.type, link.color, link.brand) for link in links}
+            for filament_type, color, brand in filaments:
+                if (filament_type, color, brand) not in found:
+                    raise ValueError(f"Filament {filament_type} {color} {brand} not found in group {group_id}")
+            
+            for link in links:
+                session.delete(link)
+            return True
+    
     def get_filament_link_groups(self):
         """Get all filament link groups with their linked filaments."""
         session = self.Session()
@@ -105,21 +105,21 @@ class TestFilamentApp(unittest.TestCase):
         self.assertIsNotNone(filament_tab)
         
         # Check that the filament table has data
-        self.assertEqual(filament_tab.filament_table.rowCount(), 3)
+        self.assertEqual(filament_tab.filament_table.model().rowCount(), 3)
     
     def test_004_aggregated_inventory_loads(self):
         """Test that the aggregated inventory loads correctly."""
         filament_tab = self.main_window.filament_tab
         
         # Check that the aggregated table has data
-        self.assertEqual(filament_tab.aggregated_table.rowCount(), 3)
+        self.assertEqual(filament_tab.aggregated_table.model().rowCount(), 3)
     
     def test_005_inventory_status_loads(self):
         """Test that the inventory status loads correctly."""
         filament_tab = self.main_window.filament_tab
         
         # Check that the status table has data
-        self.assertEqual(filament_tab.status_table.rowCount(), 3)
+        self.assertEqual(filament_tab.status_table.model().rowCount(), 3)
     
     def test_006_edit_filament(self):
         """Test the edit filament functionality."""
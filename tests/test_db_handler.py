@@ -104,6 +104,99 @@ class TestDatabaseHandler(unittest.TestCase):
         self.assertEqual(filaments[0].type, self.test_filament_data['filament_type'])
         self.assertEqual(filaments[0].color, self.test_filament_data['color'])
     
+    def test_add_filaments(self):
+        """Test adding several spools at once and reading the filament facets."""
+        # Add three identical spools in one call
+        filament_ids = self.db_handler.add_filaments(
+            self.test_filament_data['filament_type'],
+            self.test_filament_data['color'],
+            self.test_filament_data['brand'],
+            self.test_filament_data['spool_weight'],
+            count=3
+        )
+        self.db_handler.add_filament('PETG', 'Blue', 'OtherBrand', 750.0)
+        
+        # Verify
+        self.assertEqual(len(filament_ids), 3)
+        self.assertEqual(len(set(filament_ids)), 3)
+        filaments = self.db_handler.get_filaments()
+        self.assertEqual(len(filaments), 4)
+        self.assertEqual(filaments[0].quantity_remaining, self.test_filament_data['spool_weight'])
+        self.assertEqual(
+            [filament.id for filament in self.db_handler.get_filaments_by_ids(reversed(filament_ids))],
+            sorted(filament_ids)
+        )
+        
+        self.assertEqual(
+            self.db_handler.get_distinct_filament_triples(),
+            [('PETG', 'Blue', 'OtherBrand'), ('PLA', 'Red', 'TestBrand')]
+        )
+        
+        types, colors, brands = self.db_handler.get_filament_facets()
+        self.assertEqual(sorted(types), ['PETG', 'PLA'])
+        self.assertEqual(sorted(colors), ['Blue', 'Red'])
+        self.assertEqual(sorted(brands), ['OtherBrand', 'TestBrand'])
+    
+    def test_get_filaments_cached(self):
+        """Test that the cached filament list is reused until a filament changes."""
+        filament_id = self.db_handler.add_filament('PLA', 'Red', 'TestBrand', 1000.0)
+        
+        # Repeated reads reuse the cached list
+        first = self.db_handler.get_filaments_cached()
+        self.assertEqual(len(first), 1)
+        self.assertIs(self.db_handler.get_filaments_cached()[0], first[0])
+        
+        # Writes invalidate the cache
+        self.db_handler.update_filament_quantity(filament_id, 500.0)
+        self.assertEqual(self.db_handler.get_filaments_cached()[0].quantity_remaining, 500.0)
+        self.db_handler.add_filament('PETG', 'Blue', 'TestBrand', 1000.0)
+        self.assertEqual(len(self.db_handler.get_filaments_cached()), 2)
+        self.db_handler.delete_filament(filament_id)
+        self.assertEqual(len(self.db_handler.get_filaments_cached()), 1)
+    
+    def test_get_filament_facets_cached(self):
+        """Test that the cached dropdown facets refresh after a filament write."""
+        self.db_handler.add_filament('PLA', 'Red', 'TestBrand', 1000.0)
+        types, colors, brands = self.db_handler.get_filament_facets_cached()
+        self.assertEqual(types, ['PLA'])
+        
+        # Callers get their own lists
+        types.append('Changed')
+        self.assertEqual(self.db_handler.get_filament_facets_cached()[0], ['PLA'])
+        
+        self.db_handler.add_filament('PETG', 'Blue', 'OtherBrand', 1000.0)
+        types, colors, brands = self.db_handler.get_filament_facets_cached()
+        self.assertEqual(sorted(types), ['PETG', 'PLA'])
+        self.assertEqual(sorted(brands), ['OtherBrand', 'TestBrand'])
+    
+    def test_bulk_link_group_membership(self):
+        """Test adding and removing several filaments to a link group at once."""
+        group_id = self.db_handler.create_filament_link_group('Reds', ideal_quantity=2000.0)
+        other_id = self.db_handler.create_filament_link_group('Others')
+        self.db_handler.add_filament_to_link_group(other_id, 'ABS', 'Gray', 'TestBrand')
+        
+        # Add two filaments in one call
+        self.db_handler.add_filaments_to_link_group(
+            group_id, [('PLA', 'Red', 'TestBrand'), ('PETG', 'Red', 'TestBrand')]
+        )
+        group = self.db_handler.get_filament_link_group(group_id)
+        self.assertEqual(len(group.filament_links), 2)
+        
+        # A filament from another group rejects the whole batch
+        with self.assertRaises(ValueError):
+            self.db_handler.add_filaments_to_link_group(
+                group_id, [('TPU', 'Red', 'TestBrand'), ('ABS', 'Gray', 'TestBrand')]
+            )
+        group = self.db_handler.get_filament_link_group(group_id)
+        self.assertEqual(len(group.filament_links), 2)
+        
+        # Remove both in one call
+        self.db_handler.remove_filaments_from_link_group(
+            group_id, [('PLA', 'Red', 'TestBrand'), ('PETG', 'Red', 'TestBrand')]
+        )
+        group = self.db_handler.get_filament_link_group(group_id)
+        self.assertEqual(len(group.filament_links), 0)
+    
     def test_update_filament_quantity(self):
         """Test updating a filament's quantity."""
         # Add a filament
@@ -130,6 +223,72 @@ class TestDatabaseHandler(unittest.TestCase):
         # Clean up the session
         session.close()
     
+    def test_get_aggregated_filament_inventory(self):
+        """Test that filaments are aggregated per type, color and brand."""
+        first_id = self.db_handler.add_filament('PLA', 'Red', 'TestBrand', 1000.0, 400.0, 20.0)
+        second_id = self.db_handler.add_filament('PLA', 'Red', 'TestBrand', 1000.0, 600.0, None)
+        self.db_handler.add_filament('PETG', 'Blue', 'TestBrand', 500.0, 500.0, 30.0)
+        
+        inventory = {
+            (item['type'], item['color'], item['brand']): item
+            for item in self.db_handler.get_aggregated_filament_inventory()
+        }
+        self.assertEqual(len(inventory), 2)
+        
+        red = inventory[('PLA', 'Red', 'TestBrand')]
+        self.assertEqual(red['total_quantity'], 2000.0)
+        self.assertEqual(red['quantity_remaining'], 1000.0)
+        self.assertEqual(red['percentage_remaining'], 50.0)
+        self.assertEqual(red['avg_price'], 20.0)  # Filaments without a price are ignored
+        self.assertEqual(red['spool_count'], 2)
+        self.assertEqual(sorted(red['filament_ids']), [first_id, second_id])
+    
+    def test_get_inventory_status_cached(self):
+        """Test that the cached inventory status refreshes after related writes."""
+        self.db_handler.add_filament('PLA', 'Red', 'TestBrand', 1000.0)
+        
+        # Repeated reads reuse the cached status
+        first = self.db_handler.get_inventory_status_cached()
+        self.assertIs(self.db_handler.get_inventory_status_cached()[0], first[0])
+        
+        # Ideal quantity, link group and filament writes invalidate it
+        self.db_handler.set_ideal_filament_quantity('PLA', 'Red', 'TestBrand', 2000.0)
+        self.assertEqual(self.db_handler.get_inventory_status_cached()[0]['ideal_quantity'], 2000.0)
+        group_id = self.db_handler.create_filament_link_group('Reds', ideal_quantity=3000.0)
+        self.db_handler.add_filament_to_link_group(group_id, 'PLA', 'Red', 'TestBrand')
+        self.assertTrue(self.db_handler.get_inventory_status_cached()[0]['is_group'])
+        self.db_handler.add_filament('PETG', 'Blue', 'TestBrand', 1000.0)
+        self.assertEqual(len(self.db_handler.get_inventory_status_cached()), 2)
+        
+        # Writes through another handler only show up on an explicit refresh
+        other_handler = DatabaseHandler(db_path=self.temp_path)
+        other_handler.set_ideal_filament_quantity('PETG', 'Blue', 'TestBrand', 500.0)
+        other_handler.engine.dispose()
+        blue = lambda status: next(item for item in status if item['color'] == 'Blue')
+        self.assertEqual(blue(self.db_handler.get_inventory_status_cached())['ideal_quantity'], 0)
+        self.assertEqual(blue(self.db_handler.get_inventory_status_cached(refresh=True))['ideal_quantity'], 500.0)
+    
+    def test_update_filaments(self):
+        """Test updating several filaments in one transaction."""
+        first_id = self.db_handler.add_filament('PLA', 'Red', 'TestBrand', 1000.0)
+        second_id = self.db_handler.add_filament('PETG', 'Blue', 'TestBrand', 1000.0)
+        
+        def update(filament_id, quantity):
+            return {
+                'filament_id': filament_id, 'filament_type': 'PLA', 'color': 'Red',
+                'brand': 'TestBrand', 'spool_weight': 1000.0, 'quantity_remaining': quantity,
+                'price': 0.0, 'purchase_date': datetime.date(2024, 1, 2)
+            }
+        
+        self.db_handler.update_filaments([update(first_id, 400.0), update(second_id, 300.0)])
+        self.assertEqual(self.db_handler.get_filament_by_id(first_id).quantity_remaining, 400.0)
+        self.assertEqual(self.db_handler.get_filament_by_id(second_id).quantity_remaining, 300.0)
+        
+        # A missing filament rolls back the whole batch
+        with self.assertRaises(ValueError):
+            self.db_handler.update_filaments([update(first_id, 100.0), update(9999, 100.0)])
+        self.assertEqual(self.db_handler.get_filament_by_id(first_id).quantity_remaining, 400.0)
+    
     def test_add_printer(self):
         """Test adding a printer to the database."""
         # Add a printer
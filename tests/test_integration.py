@@ -8,6 +8,7 @@ This test suite tests the main functionalities of the application.
 
 import sys
 import unittest
+from unittest.mock import patch
 import os
 import tempfile
 import time
@@ -19,7 +20,7 @@ import shutil
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from PyQt5.QtWidgets import QApplication, QMessageBox, QInputDialog, QDialog
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThreadPool
 from PyQt5.QtTest import QTest
 
 from database.db_handler import DatabaseHandler
@@ -156,19 +157,19 @@ class TestFilamentTrackerIntegration(unittest.TestCase):
         filament_tab = self.main_window.filament_tab
         
         # Check that the filament table has the correct number of rows
-        self.assertEqual(filament_tab.filament_table.rowCount(), 4)
+        self.assertEqual(filament_tab.filament_table.model().rowCount(), 4)
         
         # Check that the aggregated table has the correct number of rows
-        self.assertEqual(filament_tab.aggregated_table.rowCount(), 4)
+        self.assertEqual(filament_tab.aggregated_table.model().rowCount(), 4)
         
         # Check that the status table has the correct number of rows (4 filaments + 1 group)
-        self.assertEqual(filament_tab.status_table.rowCount(), 5)
+        self.assertEqual(filament_tab.status_table.model().rowCount(), 5)
     
     def test_003_add_filament(self):
         """Test adding a new filament."""
         # Access the filament tab
         filament_tab = self.main_window.filament_tab
-        initial_count = filament_tab.filament_table.rowCount()
+        initial_count = filament_tab.filament_table.model().rowCount()
         
         # Create a new FilamentDialog to bypass the UI interaction
         dialog = FilamentDialog(filament_tab)
@@ -196,7 +197,7 @@ class TestFilamentTrackerIntegration(unittest.TestCase):
         filament_tab.load_filaments()
         
         # Check that a new row was added
-        self.assertEqual(filament_tab.filament_table.rowCount(), initial_count + 1)
+        self.assertEqual(filament_tab.filament_table.model().rowCount(), initial_count + 1)
         
         # Verify the new filament appears in the database
         filaments = self.db_handler.get_filaments()
@@ -214,7 +215,7 @@ class TestFilamentTrackerIntegration(unittest.TestCase):
         filament_tab = self.main_window.filament_tab
         
         # Get the first filament's ID
-        first_filament_id = int(filament_tab.filament_table.item(0, 0).text())
+        first_filament_id = filament_tab.filament_table.model().index(0, 0).data(Qt.UserRole)
         
         # Get filament data
         filament = self.db_handler.get_filament_by_id(first_filament_id)
@@ -243,10 +244,10 @@ class TestFilamentTrackerIntegration(unittest.TestCase):
         """Test deleting a filament."""
         # Access the filament tab
         filament_tab = self.main_window.filament_tab
-        initial_count = filament_tab.filament_table.rowCount()
+        initial_count = filament_tab.filament_table.model().rowCount()
         
         # Get the last filament's ID (the TPU one we added)
-        last_filament_id = int(filament_tab.filament_table.item(initial_count-1, 0).text())
+        last_filament_id = filament_tab.filament_table.model().index(initial_count-1, 0).data(Qt.UserRole)
         
         # Delete the filament using the DatabaseHandler directly
         self.db_handler.delete_filament(last_filament_id)
@@ -255,7 +256,7 @@ class TestFilamentTrackerIntegration(unittest.TestCase):
         filament_tab.load_filaments()
         
         # Check that a row was removed
-        self.assertEqual(filament_tab.filament_table.rowCount(), initial_count - 1)
+        self.assertEqual(filament_tab.filament_table.model().rowCount(), initial_count - 1)
     
     def test_006_aggregated_inventory(self):
         """Test aggregated inventory calculation."""
@@ -378,13 +379,69 @@ class TestFilamentTrackerIntegration(unittest.TestCase):
         filament_tab.load_inventory_status()
         
         # Check color coding is applied (by testing for existence of background colors)
-        for row in range(filament_tab.status_table.rowCount()):
-            for col in range(filament_tab.status_table.columnCount()):
-                item = filament_tab.status_table.item(row, col)
-                if item:
-                    # Just check that background color is set (not specific colors,
-                    # as this would make the test too brittle)
-                    self.assertTrue(item.background().color().isValid())
+        model = filament_tab.status_table.model()
+        for row in range(model.rowCount()):
+            for col in range(model.columnCount()):
+                # Just check that background color is set (not specific colors,
+                # as this would make the test too brittle)
+                self.assertTrue(model.index(row, col).data(Qt.BackgroundRole).isValid())
+    
+    def test_011_edit_tracking_cleared_by_reload(self):
+        """Test that an inline edit is tracked and shown in bold until the table is reloaded."""
+        # Access the filament tab
+        filament_tab = self.main_window.filament_tab
+        filament_tab.load_filaments()
+        model = filament_tab.filament_model
+        filament_id = model.index(0, 0).data(Qt.UserRole)
+        self.assertFalse(filament_tab.has_unsaved_changes())
+        self.assertIsNone(model.index(0, 1).data(Qt.FontRole))
+        
+        # Edit the remaining quantity through the model, as the table's editor does
+        self.assertTrue(model.setData(model.index(0, 4), "123"))
+        self.assertIn(filament_id, filament_tab.modified_filaments)
+        self.assertTrue(model.index(0, 1).data(Qt.FontRole).bold())
+        
+        # Reloading drops the unsaved edit, its tracking and the bold font
+        filament_tab.load_filaments()
+        self.assertFalse(filament_tab.has_unsaved_changes())
+        self.assertIsNone(model.index(0, 1).data(Qt.FontRole))
+    
+    def test_012_aggregated_inventory_worker(self):
+        """Test that the aggregated inventory worker fills the table with the latest result."""
+        # Access the filament tab
+        filament_tab = self.main_window.filament_tab
+        expected_rows = len(filament_tab.db_handler.get_aggregated_filament_inventory())
+        
+        def wait_for_workers():
+            QThreadPool.globalInstance().waitForDone()
+            QApplication.processEvents()
+        
+        # Two loads in a row: only the newer request fills the table
+        filament_tab.aggregated_model.set_rows([], [], [])
+        filament_tab.load_aggregated_inventory()
+        stale_request_id = filament_tab._aggregation_request_id
+        filament_tab.load_aggregated_inventory()
+        wait_for_workers()
+        self.assertEqual(filament_tab.aggregated_model.rowCount(), expected_rows)
+        
+        # A late result from a superseded request is ignored
+        filament_tab._on_aggregated_inventory_loaded(stale_request_id, [])
+        self.assertEqual(filament_tab.aggregated_model.rowCount(), expected_rows)
+        
+        # A failed run is reported once and leaves the table as it was
+        with patch.object(filament_tab.db_handler, 'get_aggregated_filament_inventory',
+                          side_effect=RuntimeError("database locked")), \
+                patch('ui.filament_tab.QMessageBox.critical') as critical:
+            filament_tab.load_aggregated_inventory()
+            wait_for_workers()
+        critical.assert_called_once()
+        self.assertIn("database locked", critical.call_args[0][2])
+        self.assertEqual(filament_tab.aggregated_model.rowCount(), expected_rows)
+        
+        # Waiting fills the table before the call returns
+        filament_tab.aggregated_model.set_rows([], [], [])
+        filament_tab.load_aggregated_inventory(wait=True)
+        self.assertEqual(filament_tab.aggregated_model.rowCount(), expected_rows)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,8 @@ from PyQt5.QtWidgets import QApplication
 from PyQt5.QtTest import QTest
 from PyQt5.QtCore import Qt
 
-from ui.filament_tab import FilamentTab
+from ui.filament_tab import (FilamentTab, FilamentPickModel, FilamentTableModel,
+                             RawValueSortProxyModel, SearchFilterProxyModel)
 from ui.printer_tab import PrinterTab
 from ui.print_job_tab import PrintJobTab
 from ui.reports_tab import ReportsTab
@@ -31,10 +32,12 @@ class TestUIComponents(unittest.TestCase):
         
         # Mock common database methods to return empty lists
         self.db_handler.get_filaments.return_value = []
+        self.db_handler.get_filaments_cached.return_value = []
         self.db_handler.get_printers.return_value = []
         self.db_handler.get_print_jobs.return_value = []
         self.db_handler.get_aggregated_filament_inventory.return_value = []
         self.db_handler.get_inventory_status.return_value = []
+        self.db_handler.get_inventory_status_cached.return_value = []
         self.db_handler.get_filament_usage_by_type.return_value = []
         self.db_handler.get_filament_usage_by_color.return_value = []
         self.db_handler.get_printer_usage_stats.return_value = []
@@ -49,6 +52,76 @@ class TestUIComponents(unittest.TestCase):
             self.assertTrue(hasattr(tab, 'filament_table'))
             self.assertTrue(hasattr(tab, 'add_button'))
     
+    def test_filament_pick_model(self):
+        """Test checking rows in the link group picker model."""
+        model = FilamentPickModel([("PLA", "Red", "A"), ("PETG", "Blue", "B")])
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.data(model.index(1, 0)), "PETG - Blue - B")
+        self.assertEqual(model.data(model.index(0, 0), Qt.CheckStateRole), Qt.Unchecked)
+        
+        self.assertTrue(model.setData(model.index(1, 0), Qt.Checked, Qt.CheckStateRole))
+        self.assertEqual(model.checked_filaments(), [("PETG", "Blue", "B")])
+    
+    def test_filament_table_model(self):
+        """Test formatting, editing and raw-value sorting of the filament table model."""
+        model = FilamentTableModel()
+        model.set_rows(
+            [[1, "PLA", "Red", "A", 900.0, 1000.0, 90.0, 20.0],
+             [2, "PETG", "Blue", "B", 50.0, 1000.0, 5.0, None]],
+            [None, None],
+            [None, None]
+        )
+        self.assertEqual(model.data(model.index(0, 6)), "90.0%")
+        self.assertEqual(model.data(model.index(1, 7)), "N/A")
+        
+        # Editing a weight recomputes the percentage and reports the edit
+        edits = []
+        model.cell_edited.connect(lambda row, column: edits.append((row, column)))
+        self.assertTrue(model.setData(model.index(1, 4), "1000"))
+        self.assertEqual(model.data(model.index(1, 6), Qt.UserRole), 100.0)
+        self.assertEqual(edits, [(1, 4)])
+        self.assertFalse(model.setData(model.index(1, 4), "not a number"))
+        
+        # Sorting compares raw numbers, not display text
+        proxy = RawValueSortProxyModel()
+        proxy.setSourceModel(model)
+        proxy.sort(4, Qt.AscendingOrder)
+        self.assertEqual(proxy.index(0, 0).data(Qt.UserRole), 1)
+        
+        # Rows can be added and removed without a reset
+        model.append_rows([[3, "ABS", "Gray", "C", 0.0, 1000.0, 0.0, None]], [None], [None])
+        self.assertEqual(proxy.rowCount(), 3)
+        self.assertTrue(model.row_matches(2, "gray", (2,)))
+        model.remove_row(0)
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.index(0, 0).data(Qt.UserRole), 2)
+    
+    def test_search_filter_proxy_model(self):
+        """Test filtering the filament table model by search text and exact type."""
+        model = FilamentTableModel()
+        model.set_rows(
+            [[1, "PLA", "Red", "A", 900.0, 1000.0, 90.0, 20.0],
+             [2, "PETG", "Blue", "B", 50.0, 1000.0, 5.0, None],
+             [3, "PLA", "Blue", "C", 500.0, 1000.0, 50.0, None]],
+            [None] * 3,
+            [None] * 3
+        )
+        proxy = SearchFilterProxyModel(search_columns=(1, 2, 3))
+        proxy.setSourceModel(model)
+        
+        proxy.set_filter("BLUE")
+        self.assertEqual(proxy.rowCount(), 2)
+        proxy.set_filter("blue", exact={1: "PLA"})
+        self.assertEqual(proxy.rowCount(), 1)
+        self.assertEqual(proxy.index(0, 0).data(Qt.UserRole), 3)
+        proxy.set_filter("")
+        self.assertEqual(proxy.rowCount(), 3)
+        
+        # Edited cells are searchable straight away
+        model.setData(model.index(0, 2), "Green")
+        proxy.set_filter("green")
+        self.assertEqual(proxy.rowCount(), 1)
+    
     def test_printer_tab_creation(self):
         """Test that the PrinterTab can be created."""
         with patch('ui.printer_tab.QMessageBox'):  # Patch QMessageBox to avoid popups
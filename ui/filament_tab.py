@@ -2,22 +2,69 @@
 Filament inventory management tab.
 """
 import datetime
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-                             QTableWidgetItem, QPushButton, QGroupBox, QLabel, 
+from functools import partial
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                             QPushButton, QGroupBox, QLabel, 
                              QLineEdit, QDoubleSpinBox, QComboBox, QMessageBox,
                              QHeaderView, QFormLayout, QDateEdit, QTabWidget,
                              QSplitter, QDialog, QDialogButtonBox, QInputDialog,
-                             QListWidget, QListWidgetItem, QPlainTextEdit, QCheckBox,
-                             QMenu, QAction, QScrollArea, QSpinBox)
-from PyQt5.QtCore import Qt, QDate, QSortFilterProxyModel, QTimer, pyqtSignal
-from PyQt5.QtGui import QColor, QCursor
+                             QListWidget, QListWidgetItem, QPlainTextEdit,
+                             QMenu, QAction, QSpinBox, QListView,
+                             QStyledItemDelegate, QStyleOptionViewItem, QStyle,
+                             QApplication)
+from PyQt5.QtCore import (Qt, QDate, QSortFilterProxyModel, QTimer, pyqtSignal,
+                          QAbstractListModel, QAbstractTableModel, QModelIndex,
+                          QSignalBlocker, QStringListModel, QObject, QRunnable,
+                          QThreadPool)
+from PyQt5.QtGui import QColor, QCursor, QFont, QStaticText, QPalette
 
 from database.db_handler import DatabaseHandler
 
+# Row colors shared by every table cell, indexed by stock bucket
+_EMPTY_COLOR = QColor(240, 240, 240)  # Light gray for "Out of Stock"
+_NO_TARGET_COLOR = QColor(255, 255, 255)  # White for "No Ideal Target Set"
+_OVERSTOCKED_COLOR = QColor(230, 210, 255)  # Light purple for "Overstocked"
+_PERCENTAGE_COLORS = (
+    QColor(255, 200, 200),  # Light red, below 20%
+    QColor(255, 235, 156),  # Light orange, below 40%
+    QColor(255, 255, 200),  # Light yellow, below 60%
+    QColor(200, 235, 255),  # Light blue, below 80%
+    QColor(200, 255, 200)   # Light green, 80% and up
+)
+
+# Inventory status text and row color, indexed by FilamentTab._get_status_level
+_STATUS_LEVELS = (
+    ("No Target Set", _NO_TARGET_COLOR),
+    ("Out of Stock", _EMPTY_COLOR),
+    ("Dangerous", _PERCENTAGE_COLORS[0]),
+    ("Critical", _PERCENTAGE_COLORS[1]),
+    ("Low", _PERCENTAGE_COLORS[2]),
+    ("Adequate", _PERCENTAGE_COLORS[3]),
+    ("Optimal", _PERCENTAGE_COLORS[4]),
+    ("Overstocked", _OVERSTOCKED_COLOR)
+)
+
+# Rows sampled when switching back to landscape sizes columns to their contents, instead of every row
+_RESIZE_CONTENTS_ROWS = 100
+
 
 class FilamentDialog(QDialog):
     """Dialog for editing filament details."""
     
+    QUICK_PRICES = (13, 14, 15, 25, 30)  # Prices offered as one-click buttons
+    DEFAULT_WEIGHT = 1000.0  # Weight shown for a missing quantity or spool weight
+    DEFAULT_PRICE = 25  # Price shown for a missing price
+    # (attribute, filament data key, form label) of the combo and weight fields
+    COMBO_FIELDS = (
+        ('type_combo', 'type', "Type:"),
+        ('color_combo', 'color', "Color:"),
+        ('brand_combo', 'brand', "Brand:")
+    )
+    WEIGHT_FIELDS = (
+        ('quantity_input', 'quantity_remaining', "Quantity Remaining (g):"),
+        ('spool_weight_input', 'spool_weight', "Spool Weight (g):")
+    )
+    
     def __init__(self, parent=None, filament_data=None):
         """Initialize filament dialog."""
         super().__init__(parent)
@@ -38,49 +85,28 @@ class FilamentDialog(QDialog):
         
         form_layout = QFormLayout()
         
-        # Type
-        self.type_combo = QComboBox()
-        self.type_combo.setEditable(True)
-        if self.filament_data and 'type' in self.filament_data:
-            self.type_combo.addItem(self.filament_data.get('type', ''))
-            self.type_combo.setCurrentText(self.filament_data.get('type', ''))
-        form_layout.addRow("Type:", self.type_combo)
-        
-        # Color
-        self.color_combo = QComboBox()
-        self.color_combo.setEditable(True)
-        if self.filament_data and 'color' in self.filament_data:
-            self.color_combo.addItem(self.filament_data.get('color', ''))
-            self.color_combo.setCurrentText(self.filament_data.get('color', ''))
-        form_layout.addRow("Color:", self.color_combo)
-        
-        # Brand
-        self.brand_combo = QComboBox()
-        self.brand_combo.setEditable(True)
-        if self.filament_data and 'brand' in self.filament_data:
-            self.brand_combo.addItem(self.filament_data.get('brand', ''))
-            self.brand_combo.setCurrentText(self.filament_data.get('brand', ''))
-        form_layout.addRow("Brand:", self.brand_combo)
-        
-        # Quantity remaining
-        self.quantity_input = QDoubleSpinBox()
-        self.quantity_input.setRange(0, 100000)
-        self.quantity_input.setSuffix(" g")
-        if self.filament_data and 'quantity_remaining' in self.filament_data:
-            self.quantity_input.setValue(self.filament_data.get('quantity_remaining', 0))
-        else:
-            self.quantity_input.setValue(1000.0)  # Default to 1000g for new filaments
-        form_layout.addRow("Quantity Remaining (g):", self.quantity_input)
-        
-        # Spool weight
-        self.spool_weight_input = QDoubleSpinBox()
-        self.spool_weight_input.setRange(0, 100000)
-        self.spool_weight_input.setSuffix(" g")
-        if self.filament_data and 'spool_weight' in self.filament_data:
-            self.spool_weight_input.setValue(self.filament_data.get('spool_weight', 0))
-        else:
-            self.spool_weight_input.setValue(1000.0)  # Default to 1000g for new filaments
-        form_layout.addRow("Spool Weight (g):", self.spool_weight_input)
+        # Type, color and brand: editable combos whose lists populate_dropdowns fills
+        for attr, key, label in self.COMBO_FIELDS:
+            combo = QComboBox()
+            combo.setEditable(True)
+            combo.setModel(QStringListModel(combo))
+            
+            # Size from a fixed content length rather than the longest entry,
+            # and keep the popup short, so large inventories don't slow the dialog down
+            combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+            combo.setMinimumContentsLength(20)
+            combo.setMaxVisibleItems(20)
+            
+            setattr(self, attr, combo)
+            form_layout.addRow(label, combo)
+        
+        # Quantity remaining and spool weight
+        for attr, key, label in self.WEIGHT_FIELDS:
+            weight_input = QDoubleSpinBox()
+            weight_input.setRange(0, 100000)
+            weight_input.setSuffix(" g")
+            setattr(self, attr, weight_input)
+            form_layout.addRow(label, weight_input)
         
         # Price
         price_layout = QVBoxLayout()
@@ -88,19 +114,17 @@ class FilamentDialog(QDialog):
         
         self.price_input = QDoubleSpinBox()
         self.price_input.setRange(0, 1000)
-        self.price_input.setValue(25)  # Default price
         self.price_input.setPrefix("$ ")
         price_input_layout.addWidget(self.price_input)
         price_layout.addLayout(price_input_layout)
         
         # Quick price buttons
         quick_price_layout = QHBoxLayout()
-        quick_price_values = [13, 14, 15, 25, 30]
         
-        for price in quick_price_values:
+        for price in self.QUICK_PRICES:
             btn = QPushButton(f"${price}")
             btn.setMaximumWidth(40)  # Make buttons compact
-            btn.clicked.connect(lambda checked, p=price: self.price_input.setValue(p))
+            btn.clicked.connect(partial(self.price_input.setValue, price))
             quick_price_layout.addWidget(btn)
         
         quick_price_layout.addStretch()
@@ -111,10 +135,6 @@ class FilamentDialog(QDialog):
         # Purchase date
         self.date_input = QDateEdit()
         self.date_input.setCalendarPopup(True)
-        if self.filament_data and 'purchase_date' in self.filament_data:
-            self.date_input.setDate(self.filament_data.get('purchase_date', QDate.currentDate()))
-        else:
-            self.date_input.setDate(QDate.currentDate())
         form_layout.addRow("Purchase Date:", self.date_input)
         
         # Number of spools to add
@@ -138,40 +158,51 @@ class FilamentDialog(QDialog):
         
         self.setLayout(layout)
         
+        self._load_fields(self.filament_data or {})
+    
+    def _load_fields(self, data):
+        """Show filament data in the fields, with defaults for missing values."""
+        for attr, key, _label in self.COMBO_FIELDS:
+            getattr(self, attr).setCurrentText(data.get(key) or '')
+        
+        # Only None counts as missing, so a real 0 g or $0 is kept
+        for attr, key, _label in self.WEIGHT_FIELDS:
+            weight = data.get(key)
+            getattr(self, attr).setValue(weight if weight is not None else self.DEFAULT_WEIGHT)
+        price = data.get('price')
+        self.price_input.setValue(price if price is not None else self.DEFAULT_PRICE)
+        self.date_input.setDate(data.get('purchase_date') or QDate.currentDate())
+    
     def populate_dropdowns(self):
         """Populate the dropdown boxes with existing values from the database."""
         if not self.db_handler:
             return
             
-        # Get unique types, colors, and brands
-        types = self.db_handler.get_filament_types()
-        colors = self.db_handler.get_filament_colors()
-        brands = self.db_handler.get_filament_brands()
-        
-        # Add them to the respective combo boxes
-        current_type = self.type_combo.currentText()
-        self.type_combo.clear()
-        for filament_type in types:
-            if filament_type != current_type:  # Skip the current type as it's already added
-                self.type_combo.addItem(filament_type)
-        if current_type:
-            self.type_combo.setCurrentText(current_type)
-        
-        current_color = self.color_combo.currentText()
-        self.color_combo.clear()
-        for color in colors:
-            if color != current_color:  # Skip the current color as it's already added
-                self.color_combo.addItem(color)
-        if current_color:
-            self.color_combo.setCurrentText(current_color)
-        
-        current_brand = self.brand_combo.currentText()
-        self.brand_combo.clear()
-        for brand in brands:
-            if brand != current_brand:  # Skip the current brand as it's already added
-                self.brand_combo.addItem(brand)
-        if current_brand:
-            self.brand_combo.setCurrentText(current_brand)
+        # Get unique types, colors, and brands (cached until the filaments change)
+        types, colors, brands = self.db_handler.get_filament_facets_cached()
+        
+        # Swap each combo's list in one model reset
+        self._set_combo_items(self.type_combo, types)
+        self._set_combo_items(self.color_combo, colors)
+        self._set_combo_items(self.brand_combo, brands)
+    
+    def _set_combo_items(self, combo, items):
+        """Replace the items of a combo box, keeping the text currently shown."""
+        current_text = combo.currentText()
+        combo.model().setStringList(items)
+        if current_text:
+            combo.setCurrentText(current_text)
+    
+    def set_data(self, filament_data):
+        """Reset the fields from filament data so the dialog can be reused."""
+        self.filament_data = filament_data
+        parent = self.parent()
+        if parent and hasattr(parent, 'db_handler'):
+            self.db_handler = parent.db_handler
+        
+        # The same loader as setup_ui, so a reused dialog shows what a new one would
+        self._load_fields(filament_data)
+        self.populate_dropdowns()
         
     def get_data(self):
         """Get the updated data."""
@@ -191,34 +222,422 @@ class FilamentDialog(QDialog):
         }
 
 
+class CachedTextDelegate(QStyledItemDelegate):
+    """Item delegate that caches laid-out cell text as QStaticText between paints."""
+    
+    def __init__(self, parent=None):
+        """Initialize the delegate with an empty text cache."""
+        super().__init__(parent)
+        self._static_texts = {}
+    
+    def paint(self, painter, option, index):
+        """Draw the item through the style without text, then draw the cached text."""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        opt.text = ""
+        
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+        if not text:
+            return
+        
+        # Lay out each distinct text/font pair only once
+        key = (text, opt.font.key())
+        static_text = self._static_texts.get(key)
+        if static_text is None:
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(font=opt.font)
+            self._static_texts[key] = static_text
+        
+        text_rect = style.subElementRect(QStyle.SE_ItemViewItemText, opt, widget)
+        margin = style.pixelMetric(QStyle.PM_FocusFrameHMargin, None, widget) + 1
+        text_rect.adjust(margin, 0, -margin, 0)
+        
+        painter.save()
+        painter.setClipRect(text_rect)
+        painter.setFont(opt.font)
+        if opt.state & QStyle.State_Selected:
+            painter.setPen(opt.palette.color(QPalette.HighlightedText))
+        else:
+            painter.setPen(opt.palette.color(QPalette.Text))
+        
+        # Vertically centred, aligned left or right like the default delegate
+        size = static_text.size()
+        y = text_rect.top() + (text_rect.height() - size.height()) / 2
+        if opt.displayAlignment & Qt.AlignRight:
+            x = text_rect.right() - size.width()
+        else:
+            x = text_rect.left()
+        painter.drawStaticText(int(x), int(y), static_text)
+        painter.restore()
+
+
+class FilamentPickModel(QAbstractListModel):
+    """Checkable list model over (type, color, brand) tuples, used by the link group picker."""
+    
+    def __init__(self, filaments, parent=None):
+        """Initialize with a list of (type, color, brand) tuples."""
+        super().__init__(parent)
+        # Parallel lists, indexed by row
+        self._keys = list(filaments)
+        self._labels = [f"{filament_type} - {color} - {brand}" for filament_type, color, brand in self._keys]
+        self._checked = [False] * len(self._keys)
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of filaments offered."""
+        return 0 if parent.isValid() else len(self._keys)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the display text, check state or filament data for a row."""
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._labels[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[row] else Qt.Unchecked
+        if role == Qt.UserRole:
+            return self._keys[row]
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        """Toggle the check state of a row."""
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        self._checked[index.row()] = value == Qt.Checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+    
+    def flags(self, index):
+        """Rows are checkable but not editable."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+    
+    def checked_filaments(self):
+        """Get the (type, color, brand) tuple of every checked row."""
+        return [key for key, checked in zip(self._keys, self._checked) if checked]
+
+
+class RowTableModel(QAbstractTableModel):
+    """Read-only table model over rows of raw values, formatted only when Qt asks for a cell."""
+    
+    headers = ()
+    search_columns = (0, 1, 2)  # Columns the search box looks in
+    
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._rows = []  # One list of raw column values per row
+        self._backgrounds = []  # One QColor per row
+        self._payloads = []  # Source record behind each row
+        self._search_texts = {}  # Column -> lower-cased text of every row
+        self._search_blobs = []  # Lower-cased search columns of each row, joined
+    
+    def set_rows(self, rows, backgrounds, payloads):
+        """Replace every row in a single model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self._backgrounds = backgrounds
+        self._payloads = payloads
+        self._build_search_texts()
+        self.endResetModel()
+    
+    def _build_search_texts(self):
+        """Lower-case the searchable text once per load instead of once per filter pass."""
+        self._search_texts = {
+            column: [str(values[column]).lower() for values in self._rows]
+            for column in self.search_columns
+        }
+        columns = [self._search_texts[column] for column in self.search_columns]
+        self._search_blobs = ["\x1f".join(texts) for texts in zip(*columns)]
+    
+    def _update_search_texts(self, row):
+        """Refresh the cached search text of one edited row."""
+        values = self._rows[row]
+        for column in self.search_columns:
+            self._search_texts[column][row] = str(values[column]).lower()
+        self._search_blobs[row] = "\x1f".join(self._search_texts[column][row] for column in self.search_columns)
+    
+    def row_matches(self, row, needle, columns):
+        """Check whether a lower-cased needle occurs in any of the given columns of a row."""
+        if columns == self.search_columns:
+            return needle in self._search_blobs[row]
+        return any(needle in self._search_texts[column][row] for column in columns)
+    
+    def append_rows(self, rows, backgrounds, payloads):
+        """Add rows at the end without resetting the model."""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._backgrounds.extend(backgrounds)
+        self._payloads.extend(payloads)
+        for values in rows:
+            for column in self.search_columns:
+                self._search_texts[column].append(str(values[column]).lower())
+            self._search_blobs.append(
+                "\x1f".join(self._search_texts[column][-1] for column in self.search_columns)
+            )
+        self.endInsertRows()
+    
+    def replace_row(self, row, values, background, payload):
+        """Swap the contents of one row in place."""
+        self._rows[row] = values
+        self._backgrounds[row] = background
+        self._payloads[row] = payload
+        self._update_search_texts(row)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+    
+    def remove_row(self, row):
+        """Remove one row without resetting the model."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._backgrounds[row]
+        del self._payloads[row]
+        for column in self.search_columns:
+            del self._search_texts[column][row]
+        del self._search_blobs[row]
+        self.endRemoveRows()
+    
+    def row_data(self, row):
+        """Get the source record (ORM row or dict) a row was built from."""
+        return self._payloads[row]
+    
+    def row_values(self, row):
+        """Get the raw column values of a row."""
+        return self._rows[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of rows."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Number of columns."""
+        return 0 if parent.isValid() else len(self.headers)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return the column titles."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the display text, background or raw value of a cell."""
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return self.format_value(column, self._rows[row][column])
+        if role == Qt.BackgroundRole:
+            return self._backgrounds[row]
+        if role == Qt.UserRole:
+            return self._rows[row][column]
+        return None
+    
+    def format_value(self, column, value):
+        """Format a raw value for display."""
+        if isinstance(value, float):
+            return f"{value:.1f}"
+        return str(value)
+    
+    def sort_key(self, row, column):
+        """Get the value a cell sorts by; missing values sort after everything else."""
+        value = self._rows[row][column]
+        return (value is None, value)
+
+
+class FilamentTableModel(RowTableModel):
+    """Editable model for the spool inventory table."""
+    
+    headers = ("ID", "Type", "Color", "Brand", "Remaining (g)",
+               "Spool Weight (g)", "% Remaining", "Price")
+    search_columns = (1, 2, 3)
+    
+    # Emitted with (row, column) when the user edits a cell
+    cell_edited = pyqtSignal(int, int)
+    
+    def __init__(self, parent=None, color_for_percentage=None):
+        """Initialize with the function that colors a row by percentage remaining."""
+        super().__init__(parent)
+        self._color_for_percentage = color_for_percentage
+        self._bold_rows = set()
+        
+        # Built once and handed out for every unsaved row
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+    
+    def set_rows(self, rows, backgrounds, payloads):
+        """Replace every row; reloaded rows have no pending edits."""
+        self._bold_rows = set()
+        super().set_rows(rows, backgrounds, payloads)
+    
+    def replace_row(self, row, values, background, payload):
+        """Swap the contents of one row; the fresh row has no pending edits."""
+        self._bold_rows.discard(row)
+        super().replace_row(row, values, background, payload)
+    
+    def remove_row(self, row):
+        """Remove one row, shifting the unsaved-change marks below it."""
+        self._bold_rows = {bold_row - (bold_row > row) for bold_row in self._bold_rows if bold_row != row}
+        super().remove_row(row)
+    
+    def format_value(self, column, value):
+        """Format a raw value for display."""
+        if column == 6:
+            return f"{value:.1f}%"
+        if column == 7:
+            return f"{value:.2f}" if value else "N/A"
+        return super().format_value(column, value)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return cell data, with the edit value and the unsaved-changes font."""
+        if index.isValid():
+            if role == Qt.EditRole:
+                value = self._rows[index.row()][index.column()]
+                return "" if value is None else value
+            if role == Qt.FontRole and index.column() == 1 and index.row() in self._bold_rows:
+                return self._bold_font
+        return super().data(index, role)
+    
+    def flags(self, index):
+        """Everything but the ID and percentage columns is editable."""
+        flags = super().flags(index)
+        if index.isValid() and index.column() not in (0, 6):
+            flags |= Qt.ItemIsEditable
+        return flags
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        """Store an edited value and recompute the percentage remaining."""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, column = index.row(), index.column()
+        values = self._rows[row]
+        if column in (4, 5, 7):
+            if column == 7 and value in ("", "N/A", None):
+                value = None
+            else:
+                try:
+                    value = float(value)
+                except (ValueError, TypeError):
+                    return False
+        elif column in (1, 2, 3):
+            value = str(value)
+        else:
+            return False
+        values[column] = value
+        if column in self.search_columns:
+            self._update_search_texts(row)
+        
+        # Keep the percentage and row color in step with the weights
+        if column in (4, 5):
+            spool_weight = values[5] or 0.0
+            values[6] = (values[4] / spool_weight) * 100 if spool_weight else 0.0
+            if self._color_for_percentage:
+                self._backgrounds[row] = self._color_for_percentage(values[6])
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+        else:
+            self.dataChanged.emit(index, index)
+        self.cell_edited.emit(row, column)
+        return True
+    
+    def set_bold(self, row, bold):
+        """Mark or unmark a row as having unsaved changes."""
+        if bold:
+            self._bold_rows.add(row)
+        else:
+            self._bold_rows.discard(row)
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 1), [Qt.FontRole])
+
+
+class AggregatedInventoryModel(RowTableModel):
+    """Model for the aggregated inventory table."""
+    
+    headers = ("Type", "Color", "Brand", "Total Weight (g)",
+               "Remaining (g)", "% Remaining", "Spools")
+    
+    def format_value(self, column, value):
+        """Format a raw value for display."""
+        if column == 5:
+            return f"{value:.1f}%"
+        return super().format_value(column, value)
+
+
+class InventoryStatusModel(RowTableModel):
+    """Model for the inventory status table."""
+    
+    headers = ("Type", "Color", "Brand", "Current (g)",
+               "Ideal (g)", "Difference (g)", "Status")
+
+
+class RawValueSortProxyModel(QSortFilterProxyModel):
+    """Proxy that sorts on the raw row values of a RowTableModel instead of display text."""
+    
+    def lessThan(self, left, right):
+        """Compare the raw values behind two cells."""
+        model = self.sourceModel()
+        return model.sort_key(left.row(), left.column()) < model.sort_key(right.row(), right.column())
+
+
+class SearchFilterProxyModel(RawValueSortProxyModel):
+    """Sorting proxy that hides rows whose searched columns do not contain the search text."""
+    
+    def __init__(self, parent=None, search_columns=(0, 1, 2)):
+        """Initialize with the columns searched by default (searchable in the source model)."""
+        super().__init__(parent)
+        self._needle = ""  # Lower-cased once per filter change, not per row
+        self._search_columns = tuple(search_columns)
+        self._exact = {}  # Column -> raw value the column must equal
+    
+    def set_filter(self, text, search_columns=None, exact=None):
+        """Update the search text, searched columns and exact matches, refiltering once."""
+        needle = text.lower()
+        search_columns = self._search_columns if search_columns is None else tuple(search_columns)
+        exact = exact or {}
+        if (needle, search_columns, exact) == (self._needle, self._search_columns, self._exact):
+            return
+        self._needle = needle
+        self._search_columns = search_columns
+        self._exact = exact
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Check a source row against the exact matches and the search text."""
+        values = self.sourceModel().row_values(source_row)
+        for column, value in self._exact.items():
+            if values[column] != value:
+                return False
+        if not self._needle:
+            return True
+        return self.sourceModel().row_matches(source_row, self._needle, self._search_columns)
+
+
 class FilamentLinkGroupDialog(QDialog):
     """Dialog for creating and managing filament link groups."""
     
-    def __init__(self, parent=None, db_handler=None, group_id=None):
+    def __init__(self, parent=None, db_handler=None, group_id=None, filament_tab=None):
         """Initialize the dialog."""
         super().__init__(parent)
         self.db_handler = db_handler
         self.group_id = group_id
+        self.filament_tab = filament_tab  # Source of the ideal quantity snapshot
         self.group_data = None
         self.preserved_ideal_quantities = {}
-        
-        # Load group data if editing an existing group
-        if group_id:
-            self.group_data = self.db_handler.get_filament_link_group(group_id)
-            if not self.group_data:
-                QMessageBox.warning(self, "Error", f"Group with ID {group_id} not found")
-                self.reject()
-                return
+        self._linked_keys = set()  # (type, color, brand) of every linked filament
+        self.changed = False  # Whether the group was written since the dialog was (re)opened
+        self._saved_fields = None  # Name, description and ideal quantity as loaded
         
         self.setup_ui()
         
+        # Load group data if editing an existing group (reset warns if it is missing)
+        self.reset(group_id)
+        
     def setup_ui(self):
         """Setup the dialog UI."""
-        if self.group_id:
-            self.setWindowTitle("Edit Filament Link Group")
-        else:
-            self.setWindowTitle("Create Filament Link Group")
-            
         self.setMinimumWidth(600)
         self.setMinimumHeight(500)
         
@@ -229,50 +648,44 @@ class FilamentLinkGroupDialog(QDialog):
         
         # Name field
         self.name_input = QLineEdit()
-        if self.group_data:
-            self.name_input.setText(self.group_data.name)
         form_layout.addRow("Group Name:", self.name_input)
         
         # Description field
         self.description_input = QPlainTextEdit()
-        if self.group_data and self.group_data.description:
-            self.description_input.setPlainText(self.group_data.description)
         form_layout.addRow("Description:", self.description_input)
         
         # Ideal quantity
         self.ideal_qty_input = QDoubleSpinBox()
         self.ideal_qty_input.setRange(0, 100000)
         self.ideal_qty_input.setSuffix(" g")
-        if self.group_data:
-            self.ideal_qty_input.setValue(self.group_data.ideal_quantity)
         form_layout.addRow("Ideal Quantity (g):", self.ideal_qty_input)
         
         # Add the form to the layout
         layout.addLayout(form_layout)
         
-        # Linked filaments section (only for editing existing groups)
-        if self.group_id:
-            group_box = QGroupBox("Linked Filaments")
-            group_layout = QVBoxLayout()
-            
-            # List of currently linked filaments
-            self.linked_filaments_list = QListWidget()
-            self.load_linked_filaments()
-            group_layout.addWidget(self.linked_filaments_list)
-            
-            # Buttons for managing linked filaments
-            buttons_layout = QHBoxLayout()
-            self.add_filament_button = QPushButton("Add Filament")
-            self.add_filament_button.clicked.connect(self.add_filament)
-            self.remove_filament_button = QPushButton("Remove Selected")
-            self.remove_filament_button.clicked.connect(self.remove_filament)
-            
-            buttons_layout.addWidget(self.add_filament_button)
-            buttons_layout.addWidget(self.remove_filament_button)
-            
-            group_layout.addLayout(buttons_layout)
-            group_box.setLayout(group_layout)
-            layout.addWidget(group_box)
+        # Linked filaments section (only shown for existing groups)
+        self.linked_group_box = QGroupBox("Linked Filaments")
+        group_layout = QVBoxLayout()
+        
+        # List of currently linked filaments
+        self.linked_filaments_list = QListWidget()
+        self.linked_filaments_list.setUniformItemSizes(True)
+        self.linked_filaments_list.setItemDelegate(CachedTextDelegate(self.linked_filaments_list))
+        group_layout.addWidget(self.linked_filaments_list)
+        
+        # Buttons for managing linked filaments
+        buttons_layout = QHBoxLayout()
+        self.add_filament_button = QPushButton("Add Filament")
+        self.add_filament_button.clicked.connect(self.add_filament)
+        self.remove_filament_button = QPushButton("Remove Selected")
+        self.remove_filament_button.clicked.connect(self.remove_filament)
+        
+        buttons_layout.addWidget(self.add_filament_button)
+        buttons_layout.addWidget(self.remove_filament_button)
+        
+        group_layout.addLayout(buttons_layout)
+        self.linked_group_box.setLayout(group_layout)
+        layout.addWidget(self.linked_group_box)
             
         # Dialog buttons
         self.button_box = QDialogButtonBox(
@@ -283,97 +696,91 @@ class FilamentLinkGroupDialog(QDialog):
         
         layout.addWidget(self.button_box)
         self.setLayout(layout)
-        
-    def load_linked_filaments(self):
-        """Load the current linked filaments into the list."""
-        self.linked_filaments_list.clear()
-        
-        if self.group_data and self.group_data.filament_links:
-            for link in self.group_data.filament_links:
-                item_text = f"{link.type} - {link.color} - {link.brand}"
-                list_item = QListWidgetItem(item_text)
-                # Store filament data in item
-                list_item.setData(Qt.UserRole, {
-                    'type': link.type,
-                    'color': link.color,
-                    'brand': link.brand
-                })
-                self.linked_filaments_list.addItem(list_item)
     
-    def add_filament(self):
-        """Add a filament to the link group."""
-        # Store current ideal quantities to preserve them
-        preserved_ideal_quantities = {}
+    def reset(self, group_id=None):
+        """Rebind the dialog to a group (or a new one) so the same instance can be reopened.
         
-        # Get the parent FilamentTab instance to access the status table
-        parent_tab = None
-        parent = self.parent()
-        while parent:
-            if isinstance(parent, FilamentTab):
-                parent_tab = parent
-                break
-            parent = parent.parent()
-        
-        # If we found the parent tab, collect current ideal quantities
-        if parent_tab and hasattr(parent_tab, 'status_table'):
-            for row in range(parent_tab.status_table.rowCount()):
-                # Skip if any items are missing
-                if any(parent_tab.status_table.item(row, col) is None for col in [0, 1, 2, 4]):
-                    continue
-                
-                # Get filament details
-                type_item = parent_tab.status_table.item(row, 0)
-                if type_item.font().bold():  # Skip group entries
-                    continue
-                    
-                type_val = type_item.text()
-                color_val = parent_tab.status_table.item(row, 1).text()
-                brand_val = parent_tab.status_table.item(row, 2).text()
-                
-                # Get ideal quantity
-                ideal_qty_item = parent_tab.status_table.item(row, 4)
-                try:
-                    ideal_qty = float(ideal_qty_item.text())
-                    if ideal_qty > 0:  # Only preserve non-zero values
-                        preserved_ideal_quantities[(type_val, color_val, brand_val)] = ideal_qty
-                except (ValueError, TypeError):
-                    pass
+        Returns:
+            False if the group could not be found, True otherwise
+        """
+        self.group_id = group_id
+        self.group_data = None
+        self.preserved_ideal_quantities = {}
+        self._linked_keys = set()
+        self.changed = False
         
-        # Get available filaments from the database
-        filaments = self.db_handler.get_filaments()
+        if group_id:
+            self.group_data = self.db_handler.get_filament_link_group(group_id)
+            if not self.group_data:
+                QMessageBox.warning(self, "Error", f"Group with ID {group_id} not found")
+                return False
+            self._linked_keys = {
+                (link.type, link.color, link.brand) for link in self.group_data.filament_links
+            }
         
-        # Create a list of available filaments that aren't already in the group
-        available_filaments = []
+        if self.group_id:
+            self.setWindowTitle("Edit Filament Link Group")
+        else:
+            self.setWindowTitle("Create Filament Link Group")
         
-        # Get currently linked filament keys
-        linked_keys = set()
-        if self.group_data and self.group_data.filament_links:
-            for link in self.group_data.filament_links:
-                linked_keys.add((link.type, link.color, link.brand))
+        self.name_input.setText(self.group_data.name if self.group_data else "")
+        self.description_input.setPlainText(
+            self.group_data.description if self.group_data and self.group_data.description else ""
+        )
+        self.ideal_qty_input.setValue(self.group_data.ideal_quantity if self.group_data else 0)
+        self._saved_fields = self._field_values()
         
-        # Track unique filament combinations to prevent duplicates
-        unique_filaments = set()
+        self.linked_group_box.setVisible(bool(self.group_id))
+        self.load_linked_filaments()
+        return True
         
-        # Add filaments that aren't already linked
-        for filament in filaments:
-            key = (filament.type, filament.color, filament.brand)
-            
-            # Skip if already linked or already in our list (prevent duplicates)
-            if key in linked_keys or key in unique_filaments:
-                continue
-                
-            # Add to tracking set
-            unique_filaments.add(key)
+    def saved_name(self):
+        """Get the group name as it is stored in the database."""
+        return self._saved_fields[0]
+    
+    def _field_values(self):
+        """Get the name, description and ideal quantity currently entered."""
+        return (
+            self.name_input.text().strip(),
+            self.description_input.toPlainText().strip(),
+            self.ideal_qty_input.value()
+        )
+    
+    def load_linked_filaments(self):
+        """Load the current linked filaments into the list."""
+        # Repaint once after the whole list is rebuilt
+        self.linked_filaments_list.setUpdatesEnabled(False)
+        try:
+            self.linked_filaments_list.clear()
             
-            # Add to available filaments list
-            available_filaments.append({
-                'text': f"{filament.type} - {filament.color} - {filament.brand}",
-                'data': {
-                    'type': filament.type,
-                    'color': filament.color,
-                    'brand': filament.brand
-                }
-            })
+            if self.group_data and self.group_data.filament_links:
+                for link in self.group_data.filament_links:
+                    self._add_linked_item(link.type, link.color, link.brand)
+        finally:
+            self.linked_filaments_list.setUpdatesEnabled(True)
+    
+    def _add_linked_item(self, filament_type, color, brand):
+        """Append one linked filament to the list."""
+        list_item = QListWidgetItem(f"{filament_type} - {color} - {brand}")
+        # Store filament data in item
+        list_item.setData(Qt.UserRole, {
+            'type': filament_type,
+            'color': color,
+            'brand': brand
+        })
+        self.linked_filaments_list.addItem(list_item)
+    
+    def add_filament(self):
+        """Add a filament to the link group."""
+        # Get currently linked filament keys
+        linked_keys = self._linked_keys
+        
+        # Unique combinations come back de-duplicated and sorted by the database;
+        # only the ones that aren't already linked are offered
+        available_filaments = [
+            key for key in self.db_handler.get_distinct_filament_triples()
+            if key not in linked_keys
+        ]
         
         if not available_filaments:
             QMessageBox.information(self, "No Filaments", "No additional filaments available to link.")
@@ -397,42 +804,24 @@ class FilamentLinkGroupDialog(QDialog):
         # Add a label
         dialog_layout.addWidget(QLabel("Select filaments to add to this group:"))
         
-        # Create a scroll area with checkboxes
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
-        
-        # Sort filaments by type, color, brand for easier navigation
-        available_filaments.sort(key=lambda f: (f['data']['type'], f['data']['color'], f['data']['brand']))
-        
-        # Add checkboxes for each filament
-        checkboxes = []
-        for filament in available_filaments:
-            checkbox = QCheckBox(filament['text'])
-            checkbox.setProperty('filament_data', filament['data'])
-            checkbox.setProperty('search_text', filament['text'].lower())  # For searching
-            checkboxes.append(checkbox)
-            scroll_layout.addWidget(checkbox)
-            
-        # Add stretch at the end to keep checkboxes at the top
-        scroll_layout.addStretch()
-        
-        # Set the layout for the scroll content
-        scroll_content.setLayout(scroll_layout)
-        scroll_area.setWidget(scroll_content)
-        
-        # Connect search box to filter function
-        def filter_filaments():
-            search_text = search_input.text().lower()
-            for checkbox in checkboxes:
-                checkbox_text = checkbox.property('search_text')
-                checkbox.setVisible(search_text in checkbox_text)
-        
-        search_input.textChanged.connect(filter_filaments)
-        
-        # Add the scroll area to the dialog
-        dialog_layout.addWidget(scroll_area)
+        # Create a checkable list view; only the visible rows are painted
+        filament_model = FilamentPickModel(available_filaments, dialog)
+        filter_model = QSortFilterProxyModel(dialog)
+        filter_model.setSourceModel(filament_model)
+        filter_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        filament_list = QListView()
+        filament_list.setUniformItemSizes(True)
+        filament_list.setModel(filter_model)
+        
+        # Only filter once typing pauses
+        filter_timer = QTimer(dialog)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(150)
+        filter_timer.timeout.connect(lambda: filter_model.setFilterFixedString(search_input.text()))
+        search_input.textChanged.connect(lambda: filter_timer.start())
+        
+        # Add the list to the dialog
+        dialog_layout.addWidget(filament_list)
         
         # Add buttons
         button_box = QDialogButtonBox(
@@ -448,30 +837,34 @@ class FilamentLinkGroupDialog(QDialog):
         result = dialog.exec_()
         
         if result == QDialog.Accepted:
-            # Add the selected filaments to the group
-            added = False
-            for checkbox in checkboxes:
-                if checkbox.isChecked():
-                    filament_data = checkbox.property('filament_data')
-                    try:
-                        self.db_handler.add_filament_to_link_group(
-                            self.group_id,
-                            filament_data['type'],
-                            filament_data['color'],
-                            filament_data['brand']
-                        )
-                        added = True
-                    except Exception as e:
-                        QMessageBox.warning(self, "Error", f"Failed to add filament: {str(e)}")
+            # Add the selected filaments to the group in one transaction
+            selected = filament_model.checked_filaments()
+            
+            # Only reload if filaments were actually selected
+            if not selected:
+                return
             
-            # Only reload if filaments were actually added
-            if added:
-                # Reload the group data and update the list
-                self.group_data = self.db_handler.get_filament_link_group(self.group_id)
-                self.load_linked_filaments()
+            # Store current ideal quantities to preserve them, taken from the FilamentTab's
+            # snapshot only once the user has actually picked filaments to link
+            preserved_ideal_quantities = {}
+            if self.filament_tab:
+                preserved_ideal_quantities = self.filament_tab.get_ideal_quantities_snapshot()
                 
-                # Save the preserved ideal quantities for other code to use
-                self.preserved_ideal_quantities = preserved_ideal_quantities
+            try:
+                self.db_handler.add_filaments_to_link_group(self.group_id, selected)
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Failed to add filaments: {str(e)}")
+                return
+            self.changed = True
+            
+            # Append the new links instead of reloading the whole group
+            for filament_type, color, brand in selected:
+                if (filament_type, color, brand) not in self._linked_keys:
+                    self._linked_keys.add((filament_type, color, brand))
+                    self._add_linked_item(filament_type, color, brand)
+            
+            # Save the preserved ideal quantities for other code to use
+            self.preserved_ideal_quantities = preserved_ideal_quantities
     
     def remove_filament(self):
         """Remove a filament from the link group."""
@@ -490,21 +883,23 @@ class FilamentLinkGroupDialog(QDialog):
         )
         
         if result == QMessageBox.Yes:
+            # Remove all selected filaments in one transaction
+            selected = []
             for item in selected_items:
                 filament_data = item.data(Qt.UserRole)
-                try:
-                    self.db_handler.remove_filament_from_link_group(
-                        self.group_id,
-                        filament_data['type'],
-                        filament_data['color'],
-                        filament_data['brand']
-                    )
-                except Exception as e:
-                    QMessageBox.warning(self, "Error", f"Failed to remove filament: {str(e)}")
+                selected.append((filament_data['type'], filament_data['color'], filament_data['brand']))
+            try:
+                self.db_handler.remove_filaments_from_link_group(self.group_id, selected)
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Failed to remove filament: {str(e)}")
+                return
+            self.changed = True
             
-            # Reload the group data and update the list
-            self.group_data = self.db_handler.get_filament_link_group(self.group_id)
-            self.load_linked_filaments()
+            # Take the removed rows out of the list instead of reloading the whole group
+            rows = sorted((self.linked_filaments_list.row(item) for item in selected_items), reverse=True)
+            for row in rows:
+                self.linked_filaments_list.takeItem(row)
+            self._linked_keys.difference_update(selected)
     
     def accept(self):
         """Save the group data and close the dialog."""
@@ -519,20 +914,24 @@ class FilamentLinkGroupDialog(QDialog):
         
         try:
             if self.group_id:
-                # Update existing group
-                self.db_handler.update_filament_link_group(
-                    self.group_id,
-                    name=name,
-                    description=description,
-                    ideal_quantity=ideal_qty
-                )
+                # Update existing group, unless nothing was edited
+                if self._field_values() != self._saved_fields:
+                    self.changed = True
+                    self.db_handler.update_filament_link_group(
+                        self.group_id,
+                        name=name,
+                        description=description,
+                        ideal_quantity=ideal_qty
+                    )
             else:
                 # Create new group
+                self.changed = True
                 self.group_id = self.db_handler.create_filament_link_group(
                     name=name,
                     description=description,
                     ideal_quantity=ideal_qty
                 )
+            self._saved_fields = self._field_values()
             
             # Store result data where the parent can access it
             self.result_data = {
@@ -546,6 +945,33 @@ class FilamentLinkGroupDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to save group: {str(e)}")
 
 
+class AggregationSignals(QObject):
+    """Signals emitted by an AggregationWorker (a QRunnable cannot emit signals itself)."""
+    
+    finished = pyqtSignal(int, list)  # Request ID, aggregated inventory
+    failed = pyqtSignal(int, str)  # Request ID, error message
+
+
+class AggregationWorker(QRunnable):
+    """Fetch the aggregated filament inventory on a QThreadPool thread."""
+    
+    def __init__(self, db_handler, request_id):
+        """Initialize with the database handler and the ID of this load request."""
+        super().__init__()
+        self.db_handler = db_handler
+        self.request_id = request_id
+        self.signals = AggregationSignals()
+    
+    def run(self):
+        """Run the aggregation query and hand the result back to the UI thread."""
+        try:
+            inventory = self.db_handler.get_aggregated_filament_inventory()
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+            return
+        self.signals.finished.emit(self.request_id, list(inventory or []))
+
+
 class FilamentTab(QWidget):
     """Filament inventory management tab."""
     
@@ -561,10 +987,25 @@ class FilamentTab(QWidget):
         self.modified_types = set()
         self.modified_colors = set()
         self.populate_type_signal = None
+        self._edit_dialog = None  # Created lazily and reused for every edit
+        self._ideal_qty_snapshot = {}  # (type, color, brand) -> ideal quantity, kept by load_inventory_status
+        self._deferred_loads = []  # Load steps still queued after the first paint
+        self._aggregation_request_id = 0  # Only the latest aggregation result is shown
+        self._link_group_dialog = None  # Created lazily and reused for every group
+        self._manage_links_dialog = None  # Created lazily and reused, with its group list
+        self._link_groups_source = None  # Database handler the group list was last loaded from
+        self._link_groups_changed = False  # Whether Manage Links wrote anything while open
         
         # Track orientation state
         self.is_portrait = False
         
+        # Coalesce search keystrokes so each filter runs once per typing burst
+        self._pending_filters = set()
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(250)
+        self._filter_timer.timeout.connect(self._apply_pending_filters)
+        
         self.setup_ui()
         self.connect_signals()
         self.load_data()
@@ -615,7 +1056,11 @@ class FilamentTab(QWidget):
         type_layout = QHBoxLayout()
         type_layout.addWidget(QLabel("Type:"))
         self.type_filter = QComboBox()
+        self.type_filter.setModel(QStringListModel(self.type_filter))
         self.type_filter.setMinimumWidth(100)
+        self.type_filter.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.type_filter.setMinimumContentsLength(20)
+        self.type_filter.setMaxVisibleItems(20)
         self.type_filter.currentTextChanged.connect(self.filter_filament_table)
         type_layout.addWidget(self.type_filter)
         filter_layout.addLayout(type_layout)
@@ -625,28 +1070,31 @@ class FilamentTab(QWidget):
         search_layout.addWidget(QLabel("Search:"))
         self.search_filter = QLineEdit()
         self.search_filter.setPlaceholderText("Search by color, brand or type...")
-        self.search_filter.textChanged.connect(self.filter_filament_table)
+        self.search_filter.textChanged.connect(lambda: self._schedule_filter(self.filter_filament_table))
         search_layout.addWidget(self.search_filter)
         filter_layout.addLayout(search_layout)
         
         control_layout.addLayout(filter_layout)
         
         # Create filament table
-        self.filament_table = QTableWidget()
-        self.filament_table.setColumnCount(8)
-        self.filament_table.setHorizontalHeaderLabels([
-            "ID", "Type", "Color", "Brand", "Remaining (g)", 
-            "Spool Weight (g)", "% Remaining", "Price"
-        ])
+        self.filament_model = FilamentTableModel(self, self._get_status_color)
+        self.filament_proxy = SearchFilterProxyModel(self, search_columns=(1, 2, 3))
+        self.filament_proxy.setSourceModel(self.filament_model)
+        self.filament_table = QTableView()
+        self.filament_table.setModel(self.filament_proxy)
         
         # Enable sorting
+        self.filament_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)  # Keep load order until a header is clicked
         self.filament_table.setSortingEnabled(True)
         self.filament_table.horizontalHeader().setSectionsClickable(True)
-        self.filament_table.horizontalHeader().sectionClicked.connect(self.sort_filament_table)
         
         # Make all columns stretch to fill available space
         self.filament_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.filament_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.filament_table.horizontalHeader().setResizeContentsPrecision(_RESIZE_CONTENTS_ROWS)
+        self.filament_table.setSelectionBehavior(QTableView.SelectRows)
+        # Every row is a single line of text, so use one fixed row height
+        self.filament_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.filament_table.verticalHeader().setDefaultSectionSize(self.filament_table.fontMetrics().height() + 8)
         
         # Add to control panel
         control_layout.addWidget(self.filament_table)
@@ -666,26 +1114,30 @@ class FilamentTab(QWidget):
         agg_search_layout.addWidget(QLabel("Search:"))
         self.agg_search_filter = QLineEdit()
         self.agg_search_filter.setPlaceholderText("Search aggregated inventory...")
-        self.agg_search_filter.textChanged.connect(self.filter_aggregated_table)
+        self.agg_search_filter.textChanged.connect(lambda: self._schedule_filter(self.filter_aggregated_table))
         agg_search_layout.addWidget(self.agg_search_filter)
         agg_layout.addLayout(agg_search_layout)
         
         # Create aggregated table
-        self.aggregated_table = QTableWidget()
-        self.aggregated_table.setColumnCount(7)
-        self.aggregated_table.setHorizontalHeaderLabels([
-            "Type", "Color", "Brand", "Total Weight (g)", 
-            "Remaining (g)", "% Remaining", "Spools"
-        ])
+        self.aggregated_model = AggregatedInventoryModel(self)
+        self.aggregated_proxy = SearchFilterProxyModel(self)
+        self.aggregated_proxy.setSourceModel(self.aggregated_model)
+        self.aggregated_table = QTableView()
+        self.aggregated_table.setModel(self.aggregated_proxy)
         
         # Enable sorting
+        self.aggregated_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)  # Keep load order until a header is clicked
         self.aggregated_table.setSortingEnabled(True)
         self.aggregated_table.horizontalHeader().setSectionsClickable(True)
-        self.aggregated_table.horizontalHeader().sectionClicked.connect(self.sort_aggregated_table)
         
         # Configure column stretching
         self.aggregated_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.aggregated_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.aggregated_table.horizontalHeader().setResizeContentsPrecision(_RESIZE_CONTENTS_ROWS)
+        self.aggregated_table.setSelectionBehavior(QTableView.SelectRows)
+        # Every row is a single line of text, so use one fixed row height
+        self.aggregated_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.aggregated_table.verticalHeader().setDefaultSectionSize(self.aggregated_table.fontMetrics().height() + 8)
+        self.aggregated_table.setItemDelegate(CachedTextDelegate(self.aggregated_table))
         
         agg_layout.addWidget(self.aggregated_table)
         self.inventory_splitter.addWidget(agg_widget)
@@ -696,7 +1148,7 @@ class FilamentTab(QWidget):
         inventory_tab.setLayout(inventory_layout)
         
         # Add tab to sub-tabs
-        self.sub_tabs.addTab(inventory_tab, "Inventory")
+        self._inventory_tab_index = self.sub_tabs.addTab(inventory_tab, "Inventory")
         
         # Add status tab
         status_tab = QWidget()
@@ -711,7 +1163,7 @@ class FilamentTab(QWidget):
         search_layout_status.addWidget(QLabel("Search:"))
         self.search_input_status = QLineEdit()
         self.search_input_status.setPlaceholderText("Enter search term...")
-        self.search_input_status.textChanged.connect(self.filter_status_table)
+        self.search_input_status.textChanged.connect(lambda: self._schedule_filter(self.filter_status_table))
         search_layout_status.addWidget(self.search_input_status)
         
         # Search filter criteria
@@ -724,20 +1176,24 @@ class FilamentTab(QWidget):
         status_layout.addLayout(search_layout_status)
         
         # Create table for displaying inventory status
-        self.status_table = QTableWidget()
-        self.status_table.setColumnCount(7)
-        self.status_table.setHorizontalHeaderLabels([
-            "Type", "Color", "Brand", "Current (g)", 
-            "Ideal (g)", "Difference (g)", "Status"
-        ])
+        self.status_model = InventoryStatusModel(self)
+        self.status_proxy = SearchFilterProxyModel(self)
+        self.status_proxy.setSourceModel(self.status_model)
+        self.status_table = QTableView()
+        self.status_table.setModel(self.status_proxy)
         
         # Enable sorting for status table
+        self.status_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)  # Keep load order until a header is clicked
         self.status_table.setSortingEnabled(True)
         self.status_table.horizontalHeader().setSectionsClickable(True)
-        self.status_table.horizontalHeader().sectionClicked.connect(self.sort_status_table)
         
         self.status_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.status_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.status_table.horizontalHeader().setResizeContentsPrecision(_RESIZE_CONTENTS_ROWS)
+        self.status_table.setSelectionBehavior(QTableView.SelectRows)
+        # Every row is a single line of text, so use one fixed row height
+        self.status_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.status_table.verticalHeader().setDefaultSectionSize(self.status_table.fontMetrics().height() + 8)
+        self.status_table.setItemDelegate(CachedTextDelegate(self.status_table))
         
         status_layout.addWidget(self.status_table)
         
@@ -765,7 +1221,12 @@ class FilamentTab(QWidget):
         status_tab.setLayout(status_layout)
         
         # Add tab to sub-tabs
-        self.sub_tabs.addTab(status_tab, "Status")
+        self._status_tab_index = self.sub_tabs.addTab(status_tab, "Status")
+        
+        # Tables whose data changed while their sub-tab was hidden reload when it is shown
+        self._stale_sub_tabs = set()
+        self._stale_reload_pending = False  # A reload of the shown sub-tab is already queued
+        self.sub_tabs.currentChanged.connect(self._load_stale_sub_tab)
         
         # Add tab widget to main layout
         main_layout.addWidget(self.sub_tabs)
@@ -774,6 +1235,9 @@ class FilamentTab(QWidget):
         
     def adjust_for_portrait(self, is_portrait):
         """Adjust the layout based on screen orientation."""
+        # The main window polls the orientation every second, so only act on a change
+        if is_portrait == self.is_portrait:
+            return
         self.is_portrait = is_portrait
         
         if is_portrait:
@@ -785,30 +1249,20 @@ class FilamentTab(QWidget):
             
             # Optimize table column widths for narrower display
             if hasattr(self, 'filament_table'):
-                header = self.filament_table.horizontalHeader()
-                header.resizeSections(QHeaderView.ResizeToContents)
-                
-                # Make some columns fixed width and narrower
-                for col_idx, col_width in [
+                self._apply_fixed_widths(self.filament_table, [
                     (0, 40),    # ID column
                     (1, 100),   # Type column
                     (2, 80),    # Color column
                     (3, 90),    # Brand column
                     (4, 80),    # Remaining column
                     (5, 80),    # Spool Weight column
-                    (6, 60)     # Price column
-                ]:
-                    if col_idx < self.filament_table.columnCount():
-                        header.setSectionResizeMode(col_idx, QHeaderView.Fixed)
-                        header.resizeSection(col_idx, col_width)
+                    (6, 60),    # % Remaining column
+                    (7, 60)     # Price column
+                ])
             
             # Also adjust aggregated table
             if hasattr(self, 'aggregated_table'):
-                header = self.aggregated_table.horizontalHeader()
-                header.resizeSections(QHeaderView.ResizeToContents)
-                
-                # Make certain columns fixed width
-                for col_idx, col_width in [
+                self._apply_fixed_widths(self.aggregated_table, [
                     (0, 100),    # Type column
                     (1, 80),     # Color column
                     (2, 90),     # Brand column
@@ -816,18 +1270,11 @@ class FilamentTab(QWidget):
                     (4, 80),     # Remaining column
                     (5, 60),     # % Remaining column
                     (6, 50)      # Spools column
-                ]:
-                    if col_idx < self.aggregated_table.columnCount():
-                        header.setSectionResizeMode(col_idx, QHeaderView.Fixed)
-                        header.resizeSection(col_idx, col_width)
+                ])
             
             # Adjust status table
             if hasattr(self, 'status_table'):
-                header = self.status_table.horizontalHeader()
-                header.resizeSections(QHeaderView.ResizeToContents)
-                
-                # Fixed width columns
-                for col_idx, col_width in [
+                self._apply_fixed_widths(self.status_table, [
                     (0, 100),    # Type column
                     (1, 80),     # Color column
                     (2, 90),     # Brand column
@@ -835,10 +1282,7 @@ class FilamentTab(QWidget):
                     (4, 70),     # Ideal column
                     (5, 70),     # Difference column
                     (6, 60)      # Status column
-                ]:
-                    if col_idx < self.status_table.columnCount():
-                        header.setSectionResizeMode(col_idx, QHeaderView.Fixed)
-                        header.resizeSection(col_idx, col_width)
+                ])
                 
         else:
             # Reset to landscape mode (horizontal monitor)
@@ -852,99 +1296,51 @@ class FilamentTab(QWidget):
                 if hasattr(self, table_attr):
                     table = getattr(self, table_attr)
                     header = table.horizontalHeader()
-                    for i in range(table.columnCount()):
+                    for i in range(table.model().columnCount()):
                         header.setSectionResizeMode(i, QHeaderView.Interactive)
                     header.resizeSections(QHeaderView.ResizeToContents)
         
-    def sort_filament_table(self, column_index):
-        """Sort the filament table by the specified column."""
-        # Toggle between ascending and descending order
-        current_order = self.filament_table.horizontalHeader().sortIndicatorOrder()
-        if current_order == Qt.AscendingOrder:
-            self.filament_table.sortItems(column_index, Qt.DescendingOrder)
-        else:
-            self.filament_table.sortItems(column_index, Qt.AscendingOrder)
-    
-    def sort_aggregated_table(self, column_index):
-        """Sort the aggregated table by the specified column."""
-        # Toggle between ascending and descending order
-        current_order = self.aggregated_table.horizontalHeader().sortIndicatorOrder()
-        if current_order == Qt.AscendingOrder:
-            self.aggregated_table.sortItems(column_index, Qt.DescendingOrder)
-        else:
-            self.aggregated_table.sortItems(column_index, Qt.AscendingOrder)
-        
+    def _apply_fixed_widths(self, table, widths):
+        """Pin the given (column, width) pairs of a table to fixed widths."""
+        # Every listed width is set explicitly, so no content measuring pass is needed
+        header = table.horizontalHeader()
+        column_count = table.model().columnCount()
+        for col_idx, col_width in widths:
+            if col_idx < column_count:
+                header.setSectionResizeMode(col_idx, QHeaderView.Fixed)
+                header.resizeSection(col_idx, col_width)
+    
+    def _schedule_filter(self, filter_func):
+        """Queue a table filter and restart the debounce timer."""
+        self._pending_filters.add(filter_func)
+        self._filter_timer.start()
+    
+    def _apply_pending_filters(self):
+        """Run each table filter queued since the last timeout once."""
+        pending, self._pending_filters = self._pending_filters, set()
+        for filter_func in pending:
+            filter_func()
+    
     def filter_filament_table(self):
         """Filter filament table based on search input and filter criteria."""
-        try:
-            search_text = self.search_filter.text().lower()
-            type_filter = self.type_filter.currentText()
-            
-            for row in range(self.filament_table.rowCount()):
-                match = False
-                
-                # Check if row matches the type filter
-                if type_filter and type_filter != "All":
-                    type_cell = self.filament_table.item(row, 1)
-                    if type_cell and type_filter == type_cell.text():
-                        match = True
-                else:
-                    match = True
-                
-                # Apply search filter if there's search text
-                if search_text and match:
-                    match = False
-                    for col in range(1, 4):  # Check type, color, brand columns
-                        cell = self.filament_table.item(row, col)
-                        if cell and search_text in cell.text().lower():
-                            match = True
-                            break
-                
-                self.filament_table.setRowHidden(row, not match)
-        except Exception as e:
-            print(f"Error filtering filament table: {str(e)}")
-            # Don't hide any rows if there's an error
-            for row in range(self.filament_table.rowCount()):
-                self.filament_table.setRowHidden(row, False)
+        # The type filter must match the whole type, the search any of type, color or brand
+        type_filter = self.type_filter.currentText()
+        exact = {1: type_filter} if type_filter and type_filter != "All" else None
+        self.filament_proxy.set_filter(self.search_filter.text(), exact=exact)
     
     def filter_aggregated_table(self):
         """Filter the aggregated table based on search input and criteria."""
-        try:
-            search_text = self.agg_search_filter.text().lower()
-            
-            for row in range(self.aggregated_table.rowCount()):
-                match = False
-                
-                # Apply search filter if there's search text
-                if search_text:
-                    match = False
-                    for col in range(3):  # Check type, color, brand columns
-                        cell = self.aggregated_table.item(row, col)
-                        if cell and search_text in cell.text().lower():
-                            match = True
-                            break
-                else:
-                    match = True
-                
-                self.aggregated_table.setRowHidden(row, not match)
-        except Exception as e:
-            print(f"Error filtering aggregated table: {str(e)}")
-            # Don't hide any rows if there's an error
-            for row in range(self.aggregated_table.rowCount()):
-                self.aggregated_table.setRowHidden(row, False)
+        # Search type, color and brand columns
+        self.aggregated_proxy.set_filter(self.agg_search_filter.text())
 
     def on_filament_cell_changed(self, row, column):
-        """Handle filament table cell changes."""
+        """Handle filament table cell changes (row is a filament model row)."""
         if column > 0:  # Ignore ID column
-            filament_id = self.filament_table.item(row, 0).data(Qt.UserRole)
+            filament_id = self.filament_model.index(row, 0).data(Qt.UserRole)
             if filament_id:
                 self.modified_filaments.add(filament_id)
                 # Set filament name in bold to indicate unsaved changes
-                item = self.filament_table.item(row, 1)
-                if item:
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
+                self.filament_model.set_bold(row, True)
     
     def on_brand_cell_changed(self, row, column):
         """Handle brand table cell changes."""
@@ -985,88 +1381,80 @@ class FilamentTab(QWidget):
     def connect_signals(self):
         """Connect signals to handle table cell changes."""
         # Connect filament table changes
-        self.filament_table.cellChanged.connect(self.on_filament_cell_changed)
+        self.filament_model.cell_edited.connect(self.on_filament_cell_changed)
         
         # Since we don't have brand_table, type_table, or color_table,
         # we'll only track changes to the filament_table
         
     def load_data(self):
         """Load all required data."""
+        # Only the visible spool table loads synchronously; the other sub-tabs
+        # and the type filter load in stages once the event loop can paint
         self.load_filaments()
-        self.load_aggregated_inventory()
-        self.load_inventory_status()  # Load inventory status comparison
-        self.populate_dynamic_dropdowns()
-        
-        # Add a timer to refresh the inventory status once on startup
-        # This ensures all colors are properly loaded after initialization
-        QTimer.singleShot(100, self.refresh_inventory_status)
-
-    def save_filament_changes(self, row):
-        """Save changes to a filament in the database."""
-        try:
-            # Get filament data from the table
-            filament_id = self.filament_table.item(row, 0).data(Qt.UserRole)
-            
-            # Get values from the table cells
-            filament_type = self.filament_table.item(row, 1).text()
-            color = self.filament_table.item(row, 2).text()
-            brand = self.filament_table.item(row, 3).text()
-            
-            # Get quantity remaining (column 4)
-            quantity_remaining = 0.0  # Default
-            if self.filament_table.item(row, 4):
-                try:
-                    quantity_remaining = float(self.filament_table.item(row, 4).text())
-                except (ValueError, TypeError):
-                    pass
-            
-            # Get spool weight (column 5)
-            spool_weight = 1000.0  # Default
-            if self.filament_table.item(row, 5):
-                try:
-                    spool_weight = float(self.filament_table.item(row, 5).text())
-                except (ValueError, TypeError):
-                    pass
-            
-            # Get price (column 7)
-            price = 0.0  # Default
-            if self.filament_table.item(row, 7):
-                try:
-                    price_text = self.filament_table.item(row, 7).text()
-                    if price_text != "N/A":
-                        price = float(price_text)
-                except (ValueError, TypeError):
-                    pass
-            
-            # Default purchase date is today
-            purchase_date = datetime.date.today().isoformat()
-            
-            # Update filament in database
-            self.db_handler.update_filament(
-                filament_id=filament_id,
-                filament_type=filament_type,
-                color=color,
-                brand=brand,
-                spool_weight=spool_weight,
-                quantity_remaining=quantity_remaining,
-                price=price,
-                purchase_date=purchase_date
-            )
-            
-            # Reset the font weight to normal
-            for col in range(1, self.filament_table.columnCount()):
-                item = self.filament_table.item(row, col)
-                if item:
-                    font = item.font()
-                    font.setBold(False)
-                    item.setFont(font)
-            
-            # Update other views that depend on filament data
+        self._deferred_loads = [
+            self.invalidate_inventory_views,  # Status waits until its sub-tab is opened
+            self.populate_dynamic_dropdowns
+        ]
+        QTimer.singleShot(0, self._run_next_deferred_load)
+    
+    def invalidate_inventory_views(self):
+        """Reload the aggregated and status tables soon if shown, otherwise when their sub-tab is opened."""
+        self._stale_sub_tabs.update((self._inventory_tab_index, self._status_tab_index))
+        
+        # A write and the filament_updated round trip through the main window both invalidate;
+        # collapse every invalidation of one event loop pass into a single reload
+        if not self._stale_reload_pending:
+            self._stale_reload_pending = True
+            QTimer.singleShot(0, self._reload_current_sub_tab)
+    
+    def _reload_current_sub_tab(self):
+        """Reload the shown sub-tab's table once after a burst of invalidations."""
+        self._stale_reload_pending = False
+        self._load_stale_sub_tab(self.sub_tabs.currentIndex())
+    
+    def _load_stale_sub_tab(self, index):
+        """Reload the table of a sub-tab if its data changed while it was hidden."""
+        if index == self._inventory_tab_index and index in self._stale_sub_tabs:
             self.load_aggregated_inventory()
+        elif index == self._status_tab_index and index in self._stale_sub_tabs:
             self.load_inventory_status()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save filament changes: {str(e)}")
+    
+    def _run_next_deferred_load(self):
+        """Run one queued load step and yield to the event loop before the next."""
+        if not self._deferred_loads:
+            return
+        load_step = self._deferred_loads.pop(0)
+        load_step()
+        if self._deferred_loads:
+            QTimer.singleShot(0, self._run_next_deferred_load)
+
+    def _get_filament_update(self, row):
+        """Get the update_filament arguments from the raw values of a filament model row."""
+        (filament_id, filament_type, color, brand,
+         quantity_remaining, spool_weight, _percentage, price) = self.filament_model.row_values(row)
+        
+        return {
+            'filament_id': filament_id,
+            'filament_type': filament_type,
+            'color': color,
+            'brand': brand,
+            # Fall back to defaults for missing numbers
+            'spool_weight': spool_weight if spool_weight is not None else 1000.0,
+            'quantity_remaining': quantity_remaining or 0.0,
+            'price': price or 0.0,
+            # Default purchase date is today (passed as a date, no string round trip)
+            'purchase_date': datetime.date.today()
+        }
+    
+    def _refresh_filament_rows(self, rows):
+        """Reload the records of some filament model rows from the database in one query."""
+        filament_ids = [self.filament_model.row_values(row)[0] for row in rows]
+        filaments = {filament.id: filament for filament in self.db_handler.get_filaments_by_ids(filament_ids)}
+        for row, filament_id in zip(rows, filament_ids):
+            filament = filaments.get(filament_id)
+            if filament:
+                values, background = self._build_filament_row(filament)
+                self.filament_model.replace_row(row, values, background, filament)
 
     def add_filament(self):
         """Add a new filament to the database."""
@@ -1074,18 +1462,21 @@ class FilamentTab(QWidget):
         if dialog.exec_():
             filament_data = dialog.get_data()
             try:
-                self.db_handler.add_filament(
+                # Insert all requested spools in a single transaction
+                filament_ids = self.db_handler.add_filaments(
                     filament_type=filament_data.get('type', ''),
                     color=filament_data.get('color', ''),
                     brand=filament_data.get('brand', ''),
                     spool_weight=filament_data.get('spool_weight', 0),
                     quantity_remaining=filament_data.get('quantity_remaining', 0),
                     price=filament_data.get('price', 0),
-                    purchase_date=filament_data.get('purchase_date', None)
+                    purchase_date=filament_data.get('purchase_date', None),
+                    count=filament_data.get('spool_count', 1)
                 )
-                self.load_filaments()
-                self.load_aggregated_inventory()
-                self.load_inventory_status()
+                # Append only the new spools instead of reloading the whole table
+                new_filaments = self.db_handler.get_filaments_by_ids(filament_ids)
+                self.filament_model.append_rows(*self._build_rows(new_filaments, self._build_filament_row))
+                self.invalidate_inventory_views()
                 
                 # Emit signal to notify that filament data has been updated
                 self.filament_updated.emit()
@@ -1095,17 +1486,16 @@ class FilamentTab(QWidget):
     
     def edit_filament(self):
         """Edit the selected filament."""
-        selected_rows = self.filament_table.selectedItems()
-        if not selected_rows:
+        if not self.filament_table.selectionModel().hasSelection():
             QMessageBox.information(self, "No Selection", "Please select a filament to edit.")
             return
             
         # Get the filament ID from the first column of the selected row
-        row = selected_rows[0].row()
-        filament_id = int(self.filament_table.item(row, 0).text())
+        row = self._current_source_row(self.filament_table)
+        filament_id = self.filament_model.index(row, 0).data(Qt.UserRole)
         
-        # Get current filament data
-        filament = self.db_handler.get_filament_by_id(filament_id)
+        # Current filament data is the record the row was loaded from, no need to query again
+        filament = self.filament_model.row_data(row)
         if not filament:
             QMessageBox.warning(self, "Not Found", "Selected filament not found in database.")
             return
@@ -1121,8 +1511,12 @@ class FilamentTab(QWidget):
             'purchase_date': filament.purchase_date
         }
         
-        # Create and show the dialog
-        dialog = FilamentDialog(self, filament_data)
+        # Reuse the edit dialog instead of rebuilding its widgets on every edit
+        if self._edit_dialog is None:
+            self._edit_dialog = FilamentDialog(self, filament_data)
+        else:
+            self._edit_dialog.set_data(filament_data)
+        dialog = self._edit_dialog
         if dialog.exec_():
             updated_data = dialog.get_data()
             
@@ -1137,9 +1531,11 @@ class FilamentTab(QWidget):
                     price=updated_data.get('price', 0),
                     purchase_date=updated_data.get('purchase_date', None)
                 )
-                self.load_filaments()
-                self.load_aggregated_inventory()
-                self.load_inventory_status()
+                # Refresh only the edited row
+                filament = self.db_handler.get_filament_by_id(filament_id)
+                values, background = self._build_filament_row(filament)
+                self.filament_model.replace_row(row, values, background, filament)
+                self.invalidate_inventory_views()
                 
                 # Emit signal to notify that filament data has been updated
                 self.filament_updated.emit()
@@ -1149,14 +1545,13 @@ class FilamentTab(QWidget):
     
     def delete_filament(self):
         """Delete the selected filament."""
-        selected_rows = self.filament_table.selectedItems()
-        if not selected_rows:
+        if not self.filament_table.selectionModel().hasSelection():
             QMessageBox.information(self, "No Selection", "Please select a filament to delete.")
             return
             
         # Get the filament ID from the first column of the selected row
-        row = selected_rows[0].row()
-        filament_id = int(self.filament_table.item(row, 0).text())
+        row = self._current_source_row(self.filament_table)
+        filament_id = self.filament_model.index(row, 0).data(Qt.UserRole)
         
         # Confirm deletion
         reply = QMessageBox.question(
@@ -1171,9 +1566,10 @@ class FilamentTab(QWidget):
         if reply == QMessageBox.Yes:
             try:
                 self.db_handler.delete_filament(filament_id)
-                self.load_filaments()
-                self.load_aggregated_inventory()
-                self.load_inventory_status()
+                # Drop only the deleted row
+                self.filament_model.remove_row(row)
+                self.modified_filaments.discard(filament_id)
+                self.invalidate_inventory_views()
                 
                 # Emit signal to notify that filament data has been updated
                 self.filament_updated.emit()
@@ -1186,40 +1582,31 @@ class FilamentTab(QWidget):
     def set_ideal_quantity(self):
         """Set the ideal quantity for a filament type/color combination."""
         # Get selected row from status table
-        selected_rows = self.status_table.selectedItems()
-        if not selected_rows:
+        if not self.status_table.selectionModel().hasSelection():
             QMessageBox.information(self, "No Selection", "Please select a filament type/color to set ideal quantity.")
             return
             
-        row = selected_rows[0].row()
+        row = self._current_source_row(self.status_table)
+        
+        # Get the status record the row was built from
+        status_item = self.status_model.row_data(row)
+        type_text = status_item['type']
+        is_group = status_item.get('is_group', False)
         
-        # Get type and check if it's a group
-        type_text = self.status_table.item(row, 0).text()
-        is_group = type_text.startswith("Group: ")
+        # Current ideal value straight from the record
+        current_ideal_value = status_item['ideal_quantity'] or 0
         
         # For groups, we need to handle differently
         if is_group:
-            group_name = type_text.replace("Group: ", "", 1)
+            group_name = type_text
+            
+            # The group ID is stored on the row, no need to search all groups
+            group_id = status_item.get('group_id')
             
-            # Find the group ID
-            groups = self.db_handler.get_filament_link_groups()
-            group_id = None
-            for group in groups:
-                if group.name == group_name:
-                    group_id = group.id
-                    break
-                    
             if not group_id:
                 QMessageBox.warning(self, "Error", f"Group '{group_name}' not found.")
                 return
                 
-            # Get current ideal value from table
-            current_ideal = self.status_table.item(row, 4).text()
-            try:
-                current_ideal_value = float(current_ideal)
-            except (ValueError, TypeError):
-                current_ideal_value = 0
-                
             # Ask for new ideal quantity
             new_ideal, ok = QInputDialog.getDouble(
                 self,
@@ -1243,14 +1630,8 @@ class FilamentTab(QWidget):
                     QMessageBox.critical(self, "Error", f"Failed to set ideal quantity: {str(e)}")
         else:
             # Regular filament (not a group)
-            filament_color = self.status_table.item(row, 1).text()
-            filament_brand = self.status_table.item(row, 2).text()
-            current_ideal = self.status_table.item(row, 4).text()
-            
-            try:
-                current_ideal_value = float(current_ideal)
-            except (ValueError, TypeError):
-                current_ideal_value = 0
+            filament_color = status_item['color']
+            filament_brand = status_item.get('brand', "")
                 
             # Ask for new ideal quantity
             new_ideal, ok = QInputDialog.getDouble(
@@ -1272,6 +1653,23 @@ class FilamentTab(QWidget):
     
     def manage_filament_links(self):
         """Open dialog to manage filament link groups."""
+        if self._manage_links_dialog is None:
+            self._manage_links_dialog = self._create_manage_links_dialog()
+        dialog = self._manage_links_dialog
+        
+        # Groups only change through this dialog, so the list is reloaded only for a new database
+        if self._link_groups_source is not self.db_handler:
+            self._refresh_group_list(dialog)
+        
+        self._link_groups_changed = False
+        dialog.exec_()
+        
+        # Refresh inventory status to reflect any changes to link groups
+        if self._link_groups_changed:
+            self.load_inventory_status()
+    
+    def _create_manage_links_dialog(self):
+        """Create the dialog listing filament link groups."""
         # Create a dialog to show existing groups
         dialog = QDialog(self)
         dialog.setWindowTitle("Manage Filament Link Groups")
@@ -1288,15 +1686,6 @@ class FilamentTab(QWidget):
         # Add list of existing groups
         group_list = QListWidget()
         group_list.setSelectionMode(QListWidget.SingleSelection)
-        
-        # Populate list with existing groups
-        groups = self.db_handler.get_filament_link_groups()
-        for group in groups:
-            item_text = f"{group.name} ({len(group.filament_links)} filaments)"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, group.id)
-            group_list.addItem(item)
-            
         layout.addWidget(group_list)
         
         # Add buttons
@@ -1307,7 +1696,7 @@ class FilamentTab(QWidget):
         delete_button = QPushButton("Delete Selected Group")
         
         # Connect buttons
-        create_button.clicked.connect(lambda: self._create_filament_group(dialog))
+        create_button.clicked.connect(lambda: self._create_filament_group(dialog, group_list))
         edit_button.clicked.connect(lambda: self._edit_filament_group(dialog, group_list))
         delete_button.clicked.connect(lambda: self._delete_filament_group(dialog, group_list))
         
@@ -1323,17 +1712,28 @@ class FilamentTab(QWidget):
         layout.addWidget(close_button)
         
         dialog.setLayout(layout)
-        dialog.exec_()
-        
-        # Refresh inventory status to reflect any changes to link groups
-        self.load_inventory_status()
+        return dialog
+    
+    def _get_link_group_dialog(self, group_id=None):
+        """Get the shared link group dialog, reset for the given group, or None if it is missing."""
+        if self._link_group_dialog is None:
+            self._link_group_dialog = FilamentLinkGroupDialog(self, self.db_handler, filament_tab=self)
+        dialog = self._link_group_dialog
+        dialog.db_handler = self.db_handler
+        if not dialog.reset(group_id):
+            return None
+        return dialog
     
-    def _create_filament_group(self, parent_dialog):
+    def _create_filament_group(self, parent_dialog, group_list):
         """Create a new filament link group."""
-        dialog = FilamentLinkGroupDialog(self, self.db_handler)
-        if dialog.exec_():
-            # Refresh the parent dialog list
-            self._refresh_group_list(parent_dialog)
+        dialog = self._get_link_group_dialog()
+        if self._run_link_group_dialog(dialog):
+            # Append the new group instead of reloading the whole list
+            group_list.addItem(self._create_group_item(
+                dialog.group_id, dialog.saved_name(), dialog.linked_filaments_list.count()
+            ))
+            return dialog.group_id
+        return None
     
     def _edit_filament_group(self, parent_dialog, group_list):
         """Edit a selected filament link group."""
@@ -1343,10 +1743,23 @@ class FilamentTab(QWidget):
             return
             
         group_id = selected_items[0].data(Qt.UserRole)
-        dialog = FilamentLinkGroupDialog(self, self.db_handler, group_id)
-        if dialog.exec_():
-            # Refresh the parent dialog list
-            self._refresh_group_list(parent_dialog)
+        dialog = self._get_link_group_dialog(group_id)
+        if self._run_link_group_dialog(dialog):
+            # Only the edited group's name or member count can have changed
+            selected_items[0].setText(self._group_item_text(
+                dialog.saved_name(), dialog.linked_filaments_list.count()
+            ))
+    
+    def _run_link_group_dialog(self, dialog):
+        """Show a link group dialog and return whether it wrote anything."""
+        if not dialog:
+            return False
+        
+        # Members are written as they are added or removed, so a cancelled dialog may still have changes
+        dialog.exec_()
+        if dialog.changed:
+            self._link_groups_changed = True
+        return dialog.changed
     
     def _delete_filament_group(self, parent_dialog, group_list):
         """Delete a selected filament link group."""
@@ -1369,14 +1782,15 @@ class FilamentTab(QWidget):
         if result == QMessageBox.Yes:
             try:
                 self.db_handler.delete_filament_link_group(group_id)
+                self._link_groups_changed = True
                 QMessageBox.information(self, "Success", "Group deleted successfully.")
-                # Refresh the parent dialog list
-                self._refresh_group_list(parent_dialog)
+                # Drop just the deleted group from the parent dialog list
+                group_list.takeItem(group_list.row(selected_items[0]))
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete group: {str(e)}")
     
     def _refresh_group_list(self, dialog):
-        """Refresh the group list in the parent dialog."""
+        """Reload the whole group list in the parent dialog (first open or a new database)."""
         group_list = None
         
         # Find the QListWidget in the dialog
@@ -1384,21 +1798,30 @@ class FilamentTab(QWidget):
             group_list = child
             break
             
-        if group_list:
+        if group_list is not None:
             # Clear the list
             group_list.clear()
             
             # Repopulate with updated data
             groups = self.db_handler.get_filament_link_groups()
+            self._link_groups_source = self.db_handler
             for group in groups:
-                item_text = f"{group.name} ({len(group.filament_links)} filaments)"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.UserRole, group.id)
-                group_list.addItem(item)
+                group_list.addItem(self._create_group_item(group.id, group.name, len(group.filament_links)))
+    
+    def _create_group_item(self, group_id, name, filament_count):
+        """Create a group list item that carries the group ID."""
+        item = QListWidgetItem(self._group_item_text(name, filament_count))
+        item.setData(Qt.UserRole, group_id)
+        return item
+    
+    def _group_item_text(self, name, filament_count):
+        """Get the group list label for a group."""
+        return f"{name} ({filament_count} filaments)"
 
     def refresh_inventory_status(self):
-        """Refresh the inventory status display."""
-        self.load_inventory_status()
+        """Refresh the inventory status display from the database."""
+        # An explicit refresh must also see rows written outside this handler
+        self.load_inventory_status(refresh=True)
 
     def has_unsaved_changes(self):
         """Check if there are any unsaved changes in the filament tab."""
@@ -1409,13 +1832,21 @@ class FilamentTab(QWidget):
     
     def save_all_changes(self):
         """Save all pending changes in the filament tab."""
-        # Save any modified filaments
-        for filament_id in self.modified_filaments:
-            # Find the row with this filament ID
-            for row in range(self.filament_table.rowCount()):
-                if self.filament_table.item(row, 0) and self.filament_table.item(row, 0).data(Qt.UserRole) == filament_id:
-                    self.save_filament_changes(row)
-                    break
+        # Find the rows of the modified filaments in one pass
+        rows = [
+            row for row in range(self.filament_model.rowCount())
+            if self.filament_model.row_values(row)[0] in self.modified_filaments
+        ]
+        if rows:
+            try:
+                # Write every modified filament in a single transaction
+                self.db_handler.update_filaments([self._get_filament_update(row) for row in rows])
+                self._refresh_filament_rows(rows)
+                self.invalidate_inventory_views()
+            except Exception as e:
+                # Nothing was written, so keep every pending edit for another try
+                QMessageBox.critical(self, "Error", f"Failed to save filament changes: {str(e)}")
+                return
         
         # Clear modification tracking
         self.modified_filaments.clear()
@@ -1428,384 +1859,232 @@ class FilamentTab(QWidget):
 
     def populate_dynamic_dropdowns(self):
         """Populate dynamic dropdowns with data from the database."""
-        # Populate type filter dropdown
-        self.type_filter.clear()
-        self.type_filter.addItem("All")
-        
-        types = self.db_handler.get_filament_types()
-        for filament_type in types:
-            # Check if filament_type is a string or an object with a name attribute
-            if isinstance(filament_type, str):
-                self.type_filter.addItem(filament_type)
-            else:
-                self.type_filter.addItem(filament_type.name)
+        # Types come from the facet cache, which only refreshes after a filament write
+        types = self.db_handler.get_filament_facets_cached()[0]
+        
+        # Swap the type filter list in one model reset, keeping the selected type if it still exists
+        blocker = QSignalBlocker(self.type_filter)
+        current_type = self.type_filter.currentText()
+        # Check if each filament_type is a string or an object with a name attribute
+        self.type_filter.model().setStringList(["All"] + [
+            filament_type if isinstance(filament_type, str) else filament_type.name
+            for filament_type in types
+        ])
+        self.type_filter.setCurrentIndex(max(0, self.type_filter.findText(current_type)))
+        del blocker
+        
+        # Apply the type filter once
+        self.filter_filament_table()
 
+    def _current_source_row(self, view):
+        """Get the model row behind a view's current (sorted) row."""
+        return view.model().mapToSource(view.currentIndex()).row()
+    
+    def _build_rows(self, records, build_row):
+        """Turn source records into model rows, backgrounds and payloads."""
+        rows = []
+        backgrounds = []
+        payloads = []
+        for record in records:
+            try:
+                values, background = build_row(record)
+            except Exception as e:
+                # Skip the malformed record instead of aborting the whole table
+                print(f"Error loading table row {len(rows)}: {str(e)}")
+                continue
+            rows.append(values)
+            backgrounds.append(background)
+            payloads.append(record)
+        return rows, backgrounds, payloads
+    
     def load_filaments(self):
         """Load filaments from the database and display in the table."""
         try:
             # Get filaments from database
             filaments = self.db_handler.get_filaments()
-            
-            # Remember current sort settings
-            sort_column = self.filament_table.horizontalHeader().sortIndicatorSection()
-            sort_order = self.filament_table.horizontalHeader().sortIndicatorOrder()
-            
-            # Temporarily disable sorting to improve performance
-            self.filament_table.setSortingEnabled(False)
-            
-            # Clear table and set row count
-            self.filament_table.setRowCount(len(filaments))
-            
-            # Populate table with filament data
-            for row, filament in enumerate(filaments):
-                # ID column (hidden from view but used for reference)
-                id_item = QTableWidgetItem(str(filament.id))
-                id_item.setData(Qt.UserRole, filament.id)
-                self.filament_table.setItem(row, 0, id_item)
-                
-                # Type column
-                self.filament_table.setItem(row, 1, QTableWidgetItem(filament.type))
-                
-                # Color column
-                self.filament_table.setItem(row, 2, QTableWidgetItem(filament.color))
-                
-                # Brand column
-                self.filament_table.setItem(row, 3, QTableWidgetItem(filament.brand))
-                
-                # Remaining weight column
-                remaining_item = QTableWidgetItem()
-                remaining_item.setData(Qt.DisplayRole, float(filament.quantity_remaining))
-                remaining_item.setText(f"{filament.quantity_remaining:.1f}")
-                self.filament_table.setItem(row, 4, remaining_item)
-                
-                # Spool weight column
-                spool_item = QTableWidgetItem()
-                spool_item.setData(Qt.DisplayRole, float(filament.spool_weight))
-                spool_item.setText(f"{filament.spool_weight:.1f}")
-                self.filament_table.setItem(row, 5, spool_item)
-                
-                # Percentage remaining column
-                if filament.spool_weight > 0:
-                    percentage = (filament.quantity_remaining / filament.spool_weight) * 100
-                else:
-                    percentage = 0
-                    
-                percentage_item = QTableWidgetItem()
-                percentage_item.setData(Qt.DisplayRole, float(percentage))
-                percentage_item.setText(f"{percentage:.1f}%")
-                self.filament_table.setItem(row, 6, percentage_item)
-                
-                # Price column
-                if filament.price:
-                    price_item = QTableWidgetItem()
-                    price_item.setData(Qt.DisplayRole, float(filament.price))
-                    price_item.setText(f"{filament.price:.2f}")
-                    self.filament_table.setItem(row, 7, price_item)
-                else:
-                    self.filament_table.setItem(row, 7, QTableWidgetItem("N/A"))
-                
-                # Color code rows based on percentage
-                self._apply_colors_to_filament_row(row, percentage)
-            
-            # Re-enable sorting and restore previous sort
-            self.filament_table.setSortingEnabled(True)
-            if sort_column >= 0:
-                self.filament_table.sortByColumn(sort_column, sort_order)
-                
-            # Refresh filters after loading
-            self.filter_filament_table()
-            
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load filaments: {str(e)}")
-            
-    def _apply_colors_to_filament_row(self, row, percentage):
-        """Apply color coding to a filament table row based on percentage remaining."""
-        # Apply color to each cell in the row
-        for col in range(self.filament_table.columnCount()):
-            cell_item = self.filament_table.item(row, col)
-            if cell_item:
-                color = self._get_status_color(percentage)
-                cell_item.setBackground(color)
+            return
+        
+        # Hand every row to the model in one reset; cells are formatted on paint
+        # and the proxy reapplies the current filter and sort by itself
+        self.filament_model.set_rows(*self._build_rows(filaments, self._build_filament_row))
+        
+        # The reload replaced any edited rows with their saved values
+        self.modified_filaments.clear()
+    
+    def _build_filament_row(self, filament):
+        """Get the raw column values and row color of one filament."""
+        # Spool weight (guard once against missing/zero weights)
+        spool_weight = float(filament.spool_weight or 0.0)
+        quantity_remaining = float(filament.quantity_remaining)
+        
+        # Percentage remaining column
+        percentage = (quantity_remaining / spool_weight) * 100 if spool_weight else 0.0
+        
+        values = [
+            filament.id,
+            filament.type,
+            filament.color,
+            filament.brand,
+            quantity_remaining,
+            spool_weight,
+            percentage,
+            float(filament.price) if filament.price else None
+        ]
+        
+        # Color code rows based on percentage
+        return values, self._get_status_color(percentage)
     
     def _get_status_color(self, percentage):
         """Get the color for a status based on percentage."""
         if percentage == 0:
-            return QColor(240, 240, 240)  # Light gray
-        elif percentage < 20:
-            return QColor(255, 200, 200)  # Light red
-        elif percentage < 40:
-            return QColor(255, 235, 156)  # Light orange
-        elif percentage < 60:
-            return QColor(255, 255, 200)  # Light yellow
-        elif percentage < 80:
-            return QColor(200, 235, 255)  # Light blue
+            return _EMPTY_COLOR
+        return _PERCENTAGE_COLORS[max(0, min(4, int(percentage // 20)))]
+    
+    def load_aggregated_inventory(self, wait=False):
+        """Load aggregated filament inventory from database on a worker thread.
+        
+        The table is filled once the worker finishes, after this method returns.
+        
+        Args:
+            wait: Run the query on the calling thread and fill the table before returning,
+                for callers that read the table right away
+        """
+        self._stale_sub_tabs.discard(self._inventory_tab_index)
+        
+        # Newer requests supersede results of runs still in flight
+        self._aggregation_request_id += 1
+        worker = AggregationWorker(self.db_handler, self._aggregation_request_id)
+        worker.signals.finished.connect(self._on_aggregated_inventory_loaded)
+        worker.signals.failed.connect(self._on_aggregated_inventory_failed)
+        if wait:
+            # The signals are emitted on this thread, so the table is filled directly
+            worker.run()
         else:
-            return QColor(200, 255, 200)  # Light green
+            QThreadPool.globalInstance().start(worker)
     
-    def load_aggregated_inventory(self):
-        """Load aggregated filament inventory from database."""
-        try:
-            # Get aggregated inventory data
-            inventory = self.db_handler.get_aggregated_filament_inventory()
-            
-            if not inventory:
-                # Clear the table if no inventory data
-                self.aggregated_table.setRowCount(0)
-                return
-                
-            # Remember current sort settings
-            sort_column = self.aggregated_table.horizontalHeader().sortIndicatorSection()
-            sort_order = self.aggregated_table.horizontalHeader().sortIndicatorOrder()
-            
-            # Temporarily disable sorting to improve performance
-            self.aggregated_table.setSortingEnabled(False)
-            
-            # Clear table and set row count
-            self.aggregated_table.setRowCount(len(inventory))
-            
-            # Populate table with aggregated inventory data
-            for row, item in enumerate(inventory):
-                # Type column
-                self.aggregated_table.setItem(row, 0, QTableWidgetItem(item['type']))
-                
-                # Color column
-                self.aggregated_table.setItem(row, 1, QTableWidgetItem(item['color']))
-                
-                # Brand column
-                self.aggregated_table.setItem(row, 2, QTableWidgetItem(item['brand']))
-                
-                # Total weight column
-                total_weight_item = QTableWidgetItem()
-                total_weight_item.setData(Qt.DisplayRole, float(item['total_quantity']))
-                total_weight_item.setText(f"{item['total_quantity']:.1f}")
-                self.aggregated_table.setItem(row, 3, total_weight_item)
-                
-                # Remaining weight column
-                remaining_weight_item = QTableWidgetItem()
-                remaining_weight_item.setData(Qt.DisplayRole, float(item['quantity_remaining']))
-                remaining_weight_item.setText(f"{item['quantity_remaining']:.1f}")
-                self.aggregated_table.setItem(row, 4, remaining_weight_item)
-                
-                # Percentage remaining column
-                if item['total_quantity'] > 0:
-                    percentage = (item['quantity_remaining'] / item['total_quantity']) * 100
-                else:
-                    percentage = 0
-                    
-                percentage_item = QTableWidgetItem()
-                percentage_item.setData(Qt.DisplayRole, float(percentage))
-                percentage_item.setText(f"{percentage:.1f}%")
-                self.aggregated_table.setItem(row, 5, percentage_item)
-                
-                # Spools column
-                spools_item = QTableWidgetItem()
-                spools_item.setData(Qt.DisplayRole, int(item['spool_count']))
-                spools_item.setText(str(item['spool_count']))
-                self.aggregated_table.setItem(row, 6, spools_item)
-                
-                # Color code rows based on percentage
-                self._apply_colors_to_aggregated_row(row, percentage)
-            
-            # Re-enable sorting and restore previous sort
-            self.aggregated_table.setSortingEnabled(True)
-            if sort_column >= 0:
-                self.aggregated_table.sortByColumn(sort_column, sort_order)
-                
-            # Refresh filters after loading
-            self.filter_aggregated_table()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load aggregated inventory: {str(e)}")
+    def _on_aggregated_inventory_loaded(self, request_id, inventory):
+        """Fill the aggregated table with the result of the latest aggregation run."""
+        if request_id != self._aggregation_request_id:
+            return
+        
+        # Hand every row to the model in one reset (an empty inventory clears it)
+        self.aggregated_model.set_rows(*self._build_rows(inventory, self._build_aggregated_row))
     
-    def _apply_colors_to_aggregated_row(self, row, percentage):
-        """Apply color coding to an aggregated table row based on percentage remaining."""
-        # Apply color to each cell in the row
-        for col in range(self.aggregated_table.columnCount()):
-            cell_item = self.aggregated_table.item(row, col)
-            if cell_item:
-                color = self._get_status_color(percentage)
-                cell_item.setBackground(color)
+    def _on_aggregated_inventory_failed(self, request_id, error):
+        """Report a failed aggregation run unless a newer run replaced it."""
+        if request_id != self._aggregation_request_id:
+            return
+        
+        QMessageBox.critical(self, "Error", f"Failed to load aggregated inventory: {error}")
     
-    def sort_status_table(self, column_index):
-        """Sort the status table by the specified column."""
-        self.status_table.sortByColumn(column_index, Qt.AscendingOrder)
+    def _build_aggregated_row(self, item):
+        """Get the raw column values and row color of one aggregated inventory entry."""
+        # Percentage remaining column
+        total_quantity = item['total_quantity'] or 0.0
+        percentage = (item['quantity_remaining'] / total_quantity) * 100 if total_quantity else 0.0
+        
+        values = [
+            item['type'],
+            item['color'],
+            item['brand'],
+            float(item['total_quantity']),
+            float(item['quantity_remaining']),
+            float(percentage),
+            int(item['spool_count'])
+        ]
+        
+        # Color code rows based on percentage
+        return values, self._get_status_color(percentage)
     
     def filter_status_table(self):
         """Filter the status table based on search input and criteria."""
-        try:
-            search_text = self.search_input_status.text().lower()
-            filter_by = self.search_filter_combo_status.currentText()
-            
-            for row in range(self.status_table.rowCount()):
-                match = False
-                
-                # Apply search filter based on criteria
-                if search_text:
-                    if filter_by == "All":
-                        # Search in all columns
-                        match = False
-                        for col in range(3):  # Type, Color, Brand columns
-                            cell = self.status_table.item(row, col)
-                            if cell and search_text in cell.text().lower():
-                                match = True
-                                break
-                    elif filter_by == "Type":
-                        # Search only in Type column
-                        cell = self.status_table.item(row, 0)
-                        match = cell and search_text in cell.text().lower()
-                    elif filter_by == "Color":
-                        # Search only in Color column
-                        cell = self.status_table.item(row, 1)
-                        match = cell and search_text in cell.text().lower()
-                    elif filter_by == "Brand":
-                        # Search only in Brand column
-                        cell = self.status_table.item(row, 2)
-                        match = cell and search_text in cell.text().lower()
-                else:
-                    match = True
-                
-                self.status_table.setRowHidden(row, not match)
-        except Exception as e:
-            print(f"Error filtering status table: {str(e)}")
-            # Don't hide any rows if there's an error
-            for row in range(self.status_table.rowCount()):
-                self.status_table.setRowHidden(row, False)
+        # Search all of type, color and brand, or only the chosen column
+        search_columns = {
+            "Type": (0,),
+            "Color": (1,),
+            "Brand": (2,)
+        }.get(self.search_filter_combo_status.currentText(), (0, 1, 2))
+        self.status_proxy.set_filter(self.search_input_status.text(), search_columns)
 
-    def load_inventory_status(self):
-        """Load inventory status comparison (current vs ideal)."""
+    def load_inventory_status(self, refresh=False):
+        """Load inventory status comparison (current vs ideal).
+        
+        Args:
+            refresh: Re-query the database instead of reusing the cached status
+        """
         try:
-            # Get inventory status data
-            status_data = self.db_handler.get_inventory_status()
-            
-            if not status_data:
-                # Clear the table if no status data
-                self.status_table.setRowCount(0)
-                return
-                
-            # Remember current sort settings
-            sort_column = self.status_table.horizontalHeader().sortIndicatorSection()
-            sort_order = self.status_table.horizontalHeader().sortIndicatorOrder()
-            
-            # Temporarily disable sorting to improve performance
-            self.status_table.setSortingEnabled(False)
-            
-            # Clear table and set row count
-            self.status_table.setRowCount(len(status_data))
-            
-            # Populate table with status data
-            for row, item in enumerate(status_data):
-                # Store row data for status coloring
-                self.status_row_data = item
-                
-                # Type column (add prefix for groups)
-                type_text = item['type']
-                if item.get('is_group', False):
-                    type_text = f"Group: {type_text}"
-                self.status_table.setItem(row, 0, QTableWidgetItem(type_text))
-                
-                # Color column
-                self.status_table.setItem(row, 1, QTableWidgetItem(item['color']))
-                
-                # Brand column
-                self.status_table.setItem(row, 2, QTableWidgetItem(item['brand'] if 'brand' in item else ""))
-                
-                # Current quantity column
-                current_item = QTableWidgetItem()
-                current_item.setData(Qt.DisplayRole, float(item['current_quantity']))
-                current_item.setText(f"{item['current_quantity']:.1f}")
-                self.status_table.setItem(row, 3, current_item)
-                
-                # Ideal quantity column
-                ideal_item = QTableWidgetItem()
-                ideal_item.setData(Qt.DisplayRole, float(item['ideal_quantity']))
-                ideal_item.setText(f"{item['ideal_quantity']:.1f}")
-                self.status_table.setItem(row, 4, ideal_item)
-                
-                # Difference column
-                difference = item['current_quantity'] - item['ideal_quantity']
-                difference_item = QTableWidgetItem()
-                difference_item.setData(Qt.DisplayRole, float(difference))
-                difference_item.setText(f"{difference:.1f}")
-                self.status_table.setItem(row, 5, difference_item)
-                
-                # Status column
-                status_text = self._get_status_text(difference)
-                status_item = QTableWidgetItem(status_text)
-                self.status_table.setItem(row, 6, status_item)
-                
-                # Color code rows based on status
-                self._apply_colors_to_status_row(row, difference)
-            
-            # Re-enable sorting and restore previous sort
-            self.status_table.setSortingEnabled(True)
-            if sort_column >= 0:
-                self.status_table.sortByColumn(sort_column, sort_order)
-                
-            # Refresh filters after loading
-            self.filter_status_table()
-            
+            # Get inventory status data (reused until a filament, ideal quantity or link group write)
+            status_data = self.db_handler.get_inventory_status_cached(refresh=refresh)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load inventory status: {str(e)}")
+            return
+        
+        self._stale_sub_tabs.discard(self._status_tab_index)
+        
+        # Hand every row to the model in one reset (no status data clears it)
+        self._ideal_qty_snapshot = {}
+        self.status_model.set_rows(*self._build_rows(status_data or [], self._build_status_row))
+    
+    def _build_status_row(self, item):
+        """Get the raw column values and row color of one inventory status entry."""
+        # Store row data for status text and coloring
+        self.status_row_data = item
+        
+        # Remember non-zero ideal quantities of individual filaments
+        if not item.get('is_group', False) and item['ideal_quantity'] > 0:
+            self._ideal_qty_snapshot[(item['type'], item['color'], item.get('brand', ""))] = item['ideal_quantity']
+        
+        # Type column (add prefix for groups)
+        type_text = item['type']
+        if item.get('is_group', False):
+            type_text = f"Group: {type_text}"
+        
+        # Classify the row once for both the status text and the row color
+        status_text, color = _STATUS_LEVELS[self._get_status_level()]
+        
+        difference = item['current_quantity'] - item['ideal_quantity']
+        values = [
+            type_text,
+            item['color'],
+            item['brand'] if 'brand' in item else "",
+            float(item['current_quantity']),
+            float(item['ideal_quantity']),
+            float(difference),
+            status_text
+        ]
+        
+        # Color code rows based on status
+        return values, color
+    
+    def get_ideal_quantities_snapshot(self):
+        """Return a copy of the non-zero ideal quantities shown in the status table."""
+        if self._status_tab_index in self._stale_sub_tabs:
+            self.load_inventory_status()
+        return dict(self._ideal_qty_snapshot)
+    
+    def _get_status_level(self):
+        """Get the _STATUS_LEVELS index of status_row_data from its current and ideal quantities."""
+        if not getattr(self, 'status_row_data', None):
+            return 0
+        
+        ideal = self.status_row_data.get('ideal_quantity', 0)
+        if not ideal or ideal <= 0:
+            return 0  # No Target Set
+        
+        # Calculate the percentage of current to ideal
+        percentage = (self.status_row_data.get('current_quantity', 0) / ideal) * 100
+        if percentage == 0:
+            return 1  # Out of Stock
+        if percentage > 100:
+            return 7  # Overstocked
+        
+        # Dangerous, Critical, Low, Adequate and Optimal in 20% steps
+        return 2 + max(0, min(4, int(percentage // 20)))
     
     def _get_status_text(self, difference):
         """Get the status text based on the difference between current and ideal quantities."""
         if difference is None:
             return "No Target Set"
-        
-        # Calculate the percentage of current to ideal
-        if 'ideal_quantity' in getattr(self, 'status_row_data', {}) and self.status_row_data['ideal_quantity'] > 0:
-            ideal = self.status_row_data['ideal_quantity']
-            current = self.status_row_data['current_quantity']
-            percentage = (current / ideal) * 100
-            
-            if percentage == 0:
-                return "Out of Stock"
-            elif percentage < 20:
-                return "Dangerous"
-            elif percentage < 40:
-                return "Critical"
-            elif percentage < 60:
-                return "Low"
-            elif percentage < 80:
-                return "Adequate"
-            elif percentage <= 100:
-                return "Optimal"
-            else:
-                return "Overstocked"
-        else:
-            return "No Target Set"
-    
-    def _apply_colors_to_status_row(self, row, difference):
-        """Apply color coding to a status table row based on the difference."""
-        # Get the current and ideal quantities from the status_row_data
-        if not hasattr(self, 'status_row_data') or not self.status_row_data:
-            return
-            
-        ideal_qty = self.status_row_data.get('ideal_quantity', 0)
-        current_qty = self.status_row_data.get('current_quantity', 0)
-        
-        # Apply color to each cell in the row
-        for col in range(self.status_table.columnCount()):
-            cell_item = self.status_table.item(row, col)
-            if cell_item:
-                if ideal_qty == 0:
-                    color = QColor(255, 255, 255)  # White for "No Ideal Target Set"
-                else:
-                    percentage = (current_qty / ideal_qty) * 100 if ideal_qty > 0 else 0
-                    
-                    if percentage == 0:
-                        color = QColor(240, 240, 240)  # Light gray for "Out of Stock"
-                    elif percentage < 20:
-                        color = QColor(255, 200, 200)  # Light red for "Dangerous"
-                    elif percentage < 40:
-                        color = QColor(255, 235, 156)  # Light orange for "Critical"
-                    elif percentage < 60:
-                        color = QColor(255, 255, 200)  # Light yellow for "Low"
-                    elif percentage < 80:
-                        color = QColor(200, 235, 255)  # Light blue for "Adequate"
-                    elif percentage <= 100:
-                        color = QColor(200, 255, 200)  # Light green for "Optimal"
-                    else:
-                        color = QColor(230, 210, 255)  # Light purple for "Overstocked"
-                
-                cell_item.setBackground(color)
+        return _STATUS_LEVELS[self._get_status_level()][0]
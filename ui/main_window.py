@@ -150,8 +150,7 @@ class MainWindow(QMainWindow):
         """Handle updates when print jobs change."""
         # Update filament tab data
         self.filament_tab.load_filaments()
-        self.filament_tab.load_aggregated_inventory()
-        self.filament_tab.load_inventory_status()
+        self.filament_tab.invalidate_inventory_views()
         
         # Update reports
         if hasattr(self.reports_tab, 'refresh_data') and callable(getattr(self.reports_tab, 'refresh_data')):
@@ -165,9 +164,8 @@ class MainWindow(QMainWindow):
         # Update print job tab data
         self.print_job_tab.load_filament_combo()
         
-        # Update inventory displays
-        self.filament_tab.load_aggregated_inventory()
-        self.filament_tab.load_inventory_status()
+        # Update inventory displays (hidden ones refresh when shown)
+        self.filament_tab.invalidate_inventory_views()
         
         # Update reports
         if hasattr(self.reports_tab, 'refresh_data') and callable(getattr(self.reports_tab, 'refresh_data')):
@@ -201,8 +199,7 @@ class MainWindow(QMainWindow):
         elif index == 1:
             # Refresh all filament data including aggregated inventory
             self.filament_tab.load_filaments()
-            self.filament_tab.load_aggregated_inventory()
-            self.filament_tab.load_inventory_status()
+            self.filament_tab.invalidate_inventory_views()
             
         # If switching to the reports tab, refresh report data if method exists
         elif index == 3:
@@ -384,8 +381,8 @@ class MainWindow(QMainWindow):
         """Refresh all data in all tabs."""
         # Reload data in filament tab
         self.filament_tab.load_filaments()
-        self.filament_tab.load_aggregated_inventory()
-        self.filament_tab.load_inventory_status()
+        self.filament_tab.load_aggregated_inventory(wait=True)
+        self.filament_tab.refresh_inventory_status()
         self.filament_tab.populate_dynamic_dropdowns()
         
         # Reload data in printer tab
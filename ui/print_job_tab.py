@@ -349,8 +349,8 @@ class PrintJobEditDialog(QDialog):
             combo.clear()
             search_text = search_text.lower()
             
-            # Get filaments from database
-            filaments = self.db_handler.get_filaments()
+            # Filter the cached filament list instead of querying on every keystroke
+            filaments = self.db_handler.get_filaments_cached()
             
             for filament in filaments:
                 # If search text is empty or matches any field
@@ -1035,7 +1035,7 @@ class PrintJobTab(QWidget):
         
         try:
             # Get the individual filament data
-            filaments = self.db_handler.get_filaments()
+            filaments = self.db_handler.get_filaments_cached()
             selected_filament = None
             
             for filament in filaments:
@@ -1596,8 +1596,8 @@ class PrintJobTab(QWidget):
         combo.clear()
         
         try:
-            # Get filaments that match the search text
-            filaments = self.db_handler.get_filaments()
+            # Get filaments that match the search text from the cached list
+            filaments = self.db_handler.get_filaments_cached()
             combo.addItem("None", None)  # Add a None option
             
             for filament in filaments: